@@ -21,21 +21,30 @@ exclusively contain some of these sums.
 """
 
 import numpy as np
+from numba import njit
 import random
-import copy
 #import time
-import math
-from colorama import Fore, Style
 import os
 
-# Forces colors to work
-os.system("")
+# The opening book is generated by generate_opening_book.py. Without one, 
+# every board is searched.
+try:
+    from opening_book import OPENING_BOOK, BOOK_DEPTH
+except ModuleNotFoundError:
+    OPENING_BOOK = {}
+    BOOK_DEPTH = 0
 
 # The representation of a game piece in the board
 EMPTY = 0
 P1_PIECE = 1
 P2_PIECE = 2
 
+# The possible states of a board after a move
+ONGOING = 0
+P1_WIN = 1
+P2_WIN = 2
+DRAW = 3
+
 # The number of consecutive pieces needed to win
 CONNECT = 4
 
@@ -43,53 +52,182 @@ CONNECT = 4
 ROWS = 6
 COLUMNS = 7
 
+# The number of bits used to store each column of a bitboard
+HEIGHT = ROWS + 1
+
+# The order that moves are tried in, starting from the center column. Central 
+# columns are part of the most lines, so trying them first tends to find the 
+# best move early and lets alpha beta pruning cut off more of the tree.
+COLUMN_ORDER = np.array(sorted(range(COLUMNS), key=lambda col: abs(col - COLUMNS // 2)), dtype=np.int64)
+
+# Stands in for infinity in the minimax search, which only uses integer scores
+INF = np.iinfo(np.int64).max
+
+# The number of entries in the transposition table. A search to a depth of 5 
+# only visits a few thousand boards, so this leaves plenty of room while 
+# keeping a fresh table cheap to create. This is prime so that taking keys 
+# modulo the size spreads them evenly over the table.
+TABLE_SIZE = 65521
+
+# The columns of an entry in the transposition table
+TABLE_KEY = 0
+TABLE_VALUE = 1
+TABLE_DEPTH = 2
+TABLE_FLAG = 3
+TABLE_MOVE = 4
+
+# Whether the value stored in the transposition table is the exact minimax 
+# value of the board, or only a bound on it because the search was pruned
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
 """
-Initializes and returns an empty board.
+Initializes and returns an empty board. The board is a pair of bitboards, one 
+per player. Each column takes up HEIGHT bits of a bitboard, starting from the 
+bottom of the column, where the extra top bit is always left empty so that 
+shifting a line of pieces can never wrap around into the next column.
 """
 def init_board():
-    return np.zeros((ROWS, COLUMNS))
+    return np.zeros(2, dtype=np.int64)
+
+"""
+Returns the bitboard with only the bit of the specified (row, col) position 
+set. Note that row 0 is the top of the board.
+"""
+@njit(cache=True)
+def cell_bit(row, col):
+    return 1 << (col * HEIGHT + ROWS - 1 - row)
+
+"""
+Returns the bitboard masks of every CONNECT long line on the board, which 
+are the windows that a player can win with.
+"""
+def get_win_masks():
+    masks = []
+    
+    # Horizontal lines
+    for row in range(ROWS):
+        for col in range(COLUMNS - CONNECT + 1):
+            masks.append(sum(cell_bit(row, col + i) for i in range(CONNECT)))
+            
+    # Vertical lines
+    for col in range(COLUMNS):
+        for row in range(ROWS - CONNECT + 1):
+            masks.append(sum(cell_bit(row + i, col) for i in range(CONNECT)))
+            
+    # \ diagonal lines
+    for row in range(ROWS - CONNECT + 1):
+        for col in range(COLUMNS - CONNECT + 1):
+            masks.append(sum(cell_bit(row + i, col + i) for i in range(CONNECT)))
+            
+    # / diagonal lines
+    for row in range(ROWS - CONNECT + 1):
+        for col in range(COLUMNS - CONNECT + 1):
+            masks.append(sum(cell_bit(row + CONNECT - 1 - i, col + i) for i in range(CONNECT)))
+    
+    return np.array(masks, dtype=np.int64)
+
+# The masks of all lines on the board (69 on a standard board), computed once
+WIN_MASKS = get_win_masks()
+
+# The mask of the top spot of every column. A column can be played as long as 
+# its top spot is empty, and the board is full once all of them are filled.
+TOP_ROW = sum(cell_bit(0, col) for col in range(COLUMNS))
+
+"""
+Returns the number of set bits in the bitboard. The bits are summed in 
+parallel, first in pairs, then in groups of 4, then 8 and so on, so this takes 
+the same few operations however many bits are set.
+"""
+@njit(cache=True)
+def count_bits(bitboard):
+    bitboard = bitboard - ((bitboard >> 1) & 0x5555555555555555)
+    bitboard = (bitboard & 0x3333333333333333) + ((bitboard >> 2) & 0x3333333333333333)
+    bitboard = (bitboard + (bitboard >> 4)) & 0x0F0F0F0F0F0F0F0F
+    bitboard += bitboard >> 8
+    bitboard += bitboard >> 16
+    bitboard += bitboard >> 32
+    return bitboard & 0x7F
 
 """
 Places the designated player piece at the specified (row, col) position. 
 Assumes that the position is valid.
 """
+@njit(cache=True)
 def make_move(board, player_piece, row, col):
-    board[row][col] = player_piece
+    board[player_piece - 1] |= cell_bit(row, col)
+
+"""
+Removes the designated player piece from the specified (row, col) position, 
+undoing a call to make_move(). Assumes that the piece is there.
+"""
+@njit(cache=True)
+def undo_move(board, player_piece, row, col):
+    board[player_piece - 1] ^= cell_bit(row, col)
+
+"""
+Returns the piece at the specified (row, col) position.
+"""
+@njit(cache=True)
+def get_piece(board, row, col):
+    bit = cell_bit(row, col)
+    if board[0] & bit:
+        return P1_PIECE
+    elif board[1] & bit:
+        return P2_PIECE
+    return EMPTY
 
 """
 Returns whether or not the specified (row, col) position is empty.
 """
+@njit(cache=True)
 def valid_spot(board, row, col):
-    return board[row][col] == EMPTY
+    return not (board[0] | board[1]) & cell_bit(row, col)
 """
 Returns the row of the lowest empty space in the designated column. Returns 
--1 if the entire column is full.
+-1 if the entire column is full. Pieces fill a column from the bottom up, so 
+the number of pieces in it gives the lowest empty space directly.
 """
+@njit(cache=True)
 def lowest_row(board, col):
-    for row in reversed(range(ROWS)):
-        if board[row][col] == EMPTY:
-            return row
-        
-    return -1
+    column = ((board[0] | board[1]) >> (col * HEIGHT)) & ((1 << ROWS) - 1)
+    
+    # A full column holds ROWS pieces, which gives -1
+    return ROWS - 1 - count_bits(column)
 
 """
-Returns a list of all possible moves that can be made on the given board.
+Returns a list of all possible moves that can be made on the given board, in 
+COLUMN_ORDER. A column can be played as long as its top spot is empty.
 """
+@njit(cache=True)
 def get_valid_locations(board):
+	mask = board[0] | board[1]
 	valid_locations = []
-	for col in range(COLUMNS):
-		if lowest_row(board, col) > -1:
+	for col in COLUMN_ORDER:
+		if not mask & cell_bit(0, col):
 			valid_locations.append(col)
 	return valid_locations
 
 """
-Prints the board to the console.
+Returns whether or not every spot on the board has been filled.
+"""
+@njit(cache=True)
+def is_full(board):
+    return ((board[0] | board[1]) & TOP_ROW) == TOP_ROW
+
+"""
+Prints the board to the console. The console should be set up for colors 
+first with init_colors().
 """
 def print_board(board, latest_move):
+    # Only imported once a board is printed, so runs that never print skip it
+    from colorama import Fore, Style
+    
     for row in range(ROWS):
         line = Style.RESET_ALL + str(row) + ": "
         for col in range(COLUMNS):
-            cell = board[row][col]
+            cell = get_piece(board, row, col)
             item = "  "
             if row == latest_move[0] and col == latest_move[1]:
                 if int(cell) == 1:
@@ -105,70 +243,46 @@ def print_board(board, latest_move):
         print(line)
     print(Style.RESET_ALL + "   A B C D E F G\n")
 
+"""
+Sets up the console so that the colors used by print_board() work.
+"""
+def init_colors():
+    # Forces colors to work
+    os.system("")
+
 """
 Checks if the specified player has a winning combination on the board. Returns 
-true if the player has won, false otherwise.
+true if the player has won, false otherwise. Shifting the player's bitboard by 
+the distance between two neighbouring spots in a direction and AND-ing it with 
+itself leaves only the pieces that have a neighbour in that direction. Doing 
+this again with twice the distance leaves only the starts of 4 in a row. Note 
+that this is hard coded for connect 4.
 """
+@njit(cache=True)
 def check_win(board, player):
-    player_piece = P1_PIECE
-    if player == 1:
-        player_piece = P2_PIECE
+    pos = board[player]
     
-    # Check for horizontal wins
-    for row in range(ROWS):
-        for col in range(COLUMNS - CONNECT + 1):
-            playerCount = 0
-            for i in range(CONNECT):
-                if board[row][col + i] == player_piece:
-                    playerCount += 1
-            if playerCount == CONNECT:
-                return True
-            
-    # Check for vertical wins
-    for col in range(COLUMNS):
-        for row in range(ROWS - CONNECT + 1):
-            playerCount = 0
-            for i in range(CONNECT):
-                if board[row + i][col] == player_piece:
-                    playerCount += 1
-            if playerCount == CONNECT:
-                return True
-            
-    # Check for / diagonal wins
-    for row in range(ROWS - CONNECT + 1):
-        for col in range(COLUMNS - CONNECT, COLUMNS):
-            playerCount = 0
-            for i in range(CONNECT):
-                if board[row + i][col - i] == player_piece:
-                    playerCount += 1
-            if playerCount == CONNECT:
-                return True
-            
-    # Check for \ diagonal wins
-    for row in range(ROWS - CONNECT + 1):
-        for col in range(COLUMNS - CONNECT + 1):
-            playerCount = 0
-            for i in range(CONNECT):
-                if board[row + i][col + i] == player_piece:
-                    playerCount += 1
-            if playerCount == CONNECT:
-                return True
+    # Pieces with a neighbour above, to the right, on the \ diagonal down to 
+    # the right and on the / diagonal up to the right
+    vertical = pos & (pos >> 1)
+    horizontal = pos & (pos >> HEIGHT)
+    back_diagonal = pos & (pos >> (HEIGHT - 1))
+    diagonal = pos & (pos >> (HEIGHT + 1))
     
-    # No winning combinations were found for this player
-    return False
+    # All four directions are checked at once, without any branches
+    return ((vertical & (vertical >> 2))
+            | (horizontal & (horizontal >> (2 * HEIGHT)))
+            | (back_diagonal & (back_diagonal >> (2 * (HEIGHT - 1))))
+            | (diagonal & (diagonal >> (2 * (HEIGHT + 1))))) != 0
 
 """
-Returns the heuristic score of the specified player within this CONNECT long 
-window. Note that this is hard coded for connect 4.
+Returns the heuristic score of a CONNECT long window holding player_count of 
+the player's pieces and opp_count of the opponent's pieces. Note that this is 
+hard coded for connect 4.
 """
-def score_window(window, player):
-    # Determine the opponent's piece
-    player_piece = P1_PIECE
-    opp_piece = P2_PIECE
-    if player == 1:
-        player_piece = P2_PIECE
-        opp_piece = P1_PIECE
-        
+def score_window(player_count, opp_count):
+    empty_count = CONNECT - player_count - opp_count
+    
     # The heuristic score of this window
     score = 0
     
@@ -176,68 +290,94 @@ def score_window(window, player):
     # Note that we want to check for the winning combination here so that the 
     # minimax algorithm chooses the "best" win condition it can find and not 
     # just any win condition.
-    if window.count(player_piece) == 4:
+    if player_count == 4:
         score += 100
     # Check for unobstructed line of 3
-    elif window.count(player_piece) == 3 and window.count(EMPTY) == 1:
+    elif player_count == 3 and empty_count == 1:
         score += 5
     # Check for unobstructed line of 2
-    elif window.count(player_piece) == 2 and window.count(EMPTY) == 2:
+    elif player_count == 2 and empty_count == 2:
         score += 2
     # Penalize for unobstructed line of 3 for opponent pieces
-    if window.count(opp_piece) == 3 and window.count(EMPTY) == 1:
+    if opp_count == 3 and empty_count == 1:
         score -= 4
     # Penalize for unobstructed line of 2 for opponent pieces
-    elif window.count(opp_piece) == 2 and window.count(EMPTY) == 2:
+    elif opp_count == 2 and empty_count == 2:
         score -= 1
 
     return score
 
+# The score of every window, indexed by player_count * (CONNECT + 1) + 
+# opp_count, so that scoring a window is a single lookup
+SCORE_TABLE = np.array([score_window(player_count, opp_count)
+                        for player_count in range(CONNECT + 1)
+                        for opp_count in range(CONNECT + 1)], dtype=np.int64)
+
 """
 Given a board and player, calculates their hueristic score. Note that while 
 the hueristic score does give significant points for win conditions, the board 
 should be checked for a win through check_win() before calling.
 """
+@njit(cache=True)
 def score_board(board, player):
-    score = 0
+    pos = board[player]
+    opp = board[(player + 1) % 2]
     
-    # Check horizontal windows
-    for row in range(ROWS):
-        row_array = [int(i) for i in list(board[row,:])]
-        for col in range(COLUMNS - CONNECT + 1):
-            window = row_array[col:col+CONNECT]
-            score += score_window(window, player)
-            
-    # Check vertical windows
-    for col in range(COLUMNS):
-        col_array = [int(i) for i in list(board[:,col])]
-        for row in range(ROWS - CONNECT + 1):
-            window = col_array[row:row+CONNECT]
-            score += score_window(window, player)
-            
-    # Check \ diagonal windows
-    for row in range(ROWS - CONNECT + 1):
-        for col in range(COLUMNS - CONNECT + 1):
-            window = [board[row+CONNECT-1-i][col+i] for i in range(CONNECT)]
-            score += score_window(window, player)
-           
-    # Check / diagonal windows
-    for row in range(ROWS - CONNECT + 1):
-        for col in range(COLUMNS - CONNECT + 1):
-            window = [board[row+i][col+i] for i in range(CONNECT)]
-            score += score_window(window, player)
+    # Score every window on the board
+    score = 0
+    for mask in WIN_MASKS:
+        score += SCORE_TABLE[count_bits(pos & mask) * (CONNECT + 1) + count_bits(opp & mask)]
         
     return score
 
 """
-Checks if this board is terminal. A board will be terminal if either player 
-has a winning combination or if the board is completely full and there is a 
-draw.
+Returns the state of the board after the specified player has made a move, 
+which is one of ONGOING, P1_WIN, P2_WIN, or DRAW. Only the player that just 
+moved can have made a winning combination, so only their pieces are checked.
 """
-def is_terminal_board(board):
-    return check_win(board, 0) or check_win(board, 1) or len(get_valid_locations(board)) == 0
+@njit(cache=True)
+def board_status(board, just_moved):
+    if check_win(board, just_moved):
+        if just_moved == 0:
+            return P1_WIN
+        return P2_WIN
+    elif is_full(board):
+        return DRAW
+    return ONGOING
 
-def minimax(board, depth, max_depth, alpha, beta, maxPlayer, player):
+"""
+Initializes and returns an empty transposition table, which caches the 
+results of minimax searches across boards that are reached in more than one 
+way. Each row is an entry holding a board key, the value found for the board, 
+how many levels below the board were searched, the kind of value stored, and 
+the best column found for the board.
+"""
+def init_table():
+    table = np.zeros((TABLE_SIZE, 5), dtype=np.int64)
+    table[:, TABLE_KEY] = -1
+    return table
+
+"""
+Returns a key that uniquely identifies this board when scored for the 
+specified player, with maxPlayer telling whether that player moves next. 
+Adding the mask of all pieces to player 1's pieces sets a bit just above the 
+pieces of each column, so the sum tells apart every board.
+"""
+@njit(cache=True)
+def board_key(board, player, maxPlayer):
+    return ((board[0] + (board[0] | board[1])) << 2) | (player << 1) | maxPlayer
+
+"""
+Searches the game tree below this board with the minimax algorithm, using 
+alpha beta pruning, and returns the best column to drop into along with its 
+score for the specified player. The column is -1 if the board is terminal, 
+the maximum depth has been reached, or the result came from the transposition 
+table. The board is left unchanged. Unlike the other compiled functions this 
+is not cached, since numba crashes when loading recursive functions back from 
+its cache.
+"""
+@njit
+def minimax(board, depth, max_depth, alpha, beta, maxPlayer, player, table):
     # Determine the opponent's piece
     player_piece = P1_PIECE
     opp_piece = P2_PIECE
@@ -245,42 +385,75 @@ def minimax(board, depth, max_depth, alpha, beta, maxPlayer, player):
         player_piece = P2_PIECE
         opp_piece = P1_PIECE
     
-    # Check if this board is in a terminal state
-    if is_terminal_board(board):
-        # P1 win
-        if check_win(board, player):
-            return (None, 1000000)
-        # P2 win
-        elif check_win(board, (player + 1) % 2):
-            return (None, -1000000)
+    # Check if this board is in a terminal state. The opponent made the last 
+    # move if it is now the player's turn, and vice versa.
+    just_moved = player
+    if maxPlayer:
+        just_moved = (player + 1) % 2
+    status = board_status(board, just_moved)
+    if status != ONGOING:
         # Draw
+        if status == DRAW:
+            return (-1, 0)
+        # Player win
+        elif just_moved == player:
+            return (-1, 1000000)
+        # Opponent win
         else:
-            return (None, 0)
+            return (-1, -1000000)
     
     # Check if we have reached the maximum tree depth
     if depth == max_depth:
-        return (None, score_board(board, player))
+        return (-1, score_board(board, player))
+    
+    # Look this board up in the transposition table. A result is only reused if 
+    # it came from a search at least as deep as this one would be. The root is 
+    # always searched so that a column is returned.
+    key = board_key(board, player, maxPlayer)
+    index = key % TABLE_SIZE
+    if depth > 0 and table[index, TABLE_KEY] == key and table[index, TABLE_DEPTH] >= max_depth - depth:
+        value = table[index, TABLE_VALUE]
+        flag = table[index, TABLE_FLAG]
+        if flag == EXACT:
+            return (-1, value)
+        elif flag == LOWER_BOUND:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return (-1, value)
+    
+    # The window this board is searched with
+    alpha_orig = alpha
+    beta_orig = beta
     
     valid_locations = get_valid_locations(board)
     
+    # Try the best column from an earlier search of this board first
+    if table[index, TABLE_KEY] == key:
+        best_col = table[index, TABLE_MOVE]
+        valid_locations.remove(best_col)
+        valid_locations.insert(0, best_col)
+    
     # Max player (current player)
     if maxPlayer:
         # Initialize maximum at -infinity
-        value = -math.inf
-        # Make initial choice random
-        column = random.choice(valid_locations)
+        value = -INF
+        # Start with the first column to be tried, which is replaced as soon as 
+        # any column is scored
+        column = valid_locations[0]
         
         # Iterate over all successors
         for col in valid_locations:
             # Get the lowest free row for this column
             row = lowest_row(board, col)
             
-            # Create a copy of the board and make the move
-            board_copy = copy.deepcopy(board)
-            make_move(board_copy, player_piece, row, col)
+            # Make the move in place
+            make_move(board, player_piece, row, col)
             
-            # Traverse the tree to the next level
-            new_score = minimax(board_copy, depth + 1, max_depth, alpha, beta, False, player)[1]
+            # Traverse the tree to the next level, then take the move back
+            new_score = minimax(board, depth + 1, max_depth, alpha, beta, False, player, table)[1]
+            undo_move(board, player_piece, row, col)
             
             # If the children return a score higher than the current value, 
             # it becomes the new best move
@@ -294,27 +467,25 @@ def minimax(board, depth, max_depth, alpha, beta, maxPlayer, player):
             # If this alpha is greater than or equal to its parents beta, this branch is pruned
             if alpha >= beta:
                 break
-            
-        # Return the column to drop and its heuristic score
-        return column, value
     # Min player (opponent)
     else:
         # Initialize minimum at infinity
-        value = math.inf
-        # Make initial choice random
-        column = random.choice(valid_locations)
+        value = INF
+        # Start with the first column to be tried, which is replaced as soon as 
+        # any column is scored
+        column = valid_locations[0]
         
         # Iterate over all successors
         for col in valid_locations:
             # Get the lowest free row for this column
             row = lowest_row(board, col)
             
-            # Create a copy of the board and make the move
-            board_copy = copy.deepcopy(board)
-            make_move(board_copy, opp_piece, row, col)
+            # Make the move in place
+            make_move(board, opp_piece, row, col)
             
-            # Traverse the tree to the next level
-            new_score = minimax(board_copy, depth + 1, max_depth, alpha, beta, True, player)[1]
+            # Traverse the tree to the next level, then take the move back
+            new_score = minimax(board, depth + 1, max_depth, alpha, beta, True, player, table)[1]
+            undo_move(board, opp_piece, row, col)
             
             # If the children return a score lower than the current value, 
             # it becomes the new best move
@@ -328,14 +499,49 @@ def minimax(board, depth, max_depth, alpha, beta, maxPlayer, player):
             # If this beta is less than or equal to its parents alpha, this branch is pruned
             if beta <= alpha:
                 break
-        
-        # Return the column to drop and its heuristic score
-        return column, value
+    
+    # Store the result in the transposition table. A value outside of the 
+    # window is only a bound, as the search may have been pruned.
+    table[index, TABLE_KEY] = key
+    table[index, TABLE_VALUE] = value
+    table[index, TABLE_DEPTH] = max_depth - depth
+    table[index, TABLE_MOVE] = column
+    if value <= alpha_orig:
+        table[index, TABLE_FLAG] = UPPER_BOUND
+    elif value >= beta_orig:
+        table[index, TABLE_FLAG] = LOWER_BOUND
+    else:
+        table[index, TABLE_FLAG] = EXACT
+    
+    # Return the column to drop and its heuristic score
+    return column, value
+
+"""
+Returns the best column for the specified player to drop into along with its 
+score, found by a minimax search to the maximum depth. The search is 
+iteratively deepened, searching to a depth of 1, then 2, and so on. Each 
+search leaves the best column of every board it searched in the transposition 
+table, so the next, deeper search tries the principal variation of the last 
+one first. This prunes enough more of the tree to make up for the shallower 
+searches. Boards early in the game are looked up in the opening book instead 
+when searching to the depth the book was made with.
+"""
+def search(board, max_depth, player, table):
+    if max_depth == BOOK_DEPTH:
+        entry = OPENING_BOOK.get(board_key(board, player, True))
+        if entry is not None:
+            return entry
+    
+    for depth in range(1, max_depth + 1):
+        column, value = minimax(board, 0, depth, -INF, INF, True, player, table)
+    return column, value
 
 """
 Runs the game, pitting the user against an AI
 """
 def main():
+    init_colors()
+    
     # Values used to denote which player's turn it is
     p1 = 0
     p2 = 1
@@ -348,6 +554,9 @@ def main():
     
     # Initialize the board
     board = init_board()
+    
+    # Initialize the transposition table used by the AI
+    table = init_table()
 
     # Maximum depth for the minimax algorithm
     depth_input = "a"
@@ -376,7 +585,7 @@ def main():
         # AI's turn
         if player == p1:
             # Determine the move to make using the minimax algorithm
-            col, minimax_score = minimax(board, 0, max_depth, -math.inf, math.inf, True, player)
+            col, minimax_score = search(board, max_depth, player, table)
                 
             # Check if the move is valid
             row = lowest_row(board, col)
@@ -406,7 +615,7 @@ def main():
         if check_win(board, player):
             print("Player", player + 1, "wins!")
             game_over = True
-        elif len(get_valid_locations(board)) == 0:
+        elif is_full(board):
             print("Draw!")
             game_over = True
         
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Generates opening_book.py, the opening book used by the AI in Connect4.py and 
+Connect4AiVsAi.py. Every board with at most BOOK_PIECES pieces is searched 
+to a depth of BOOK_DEPTH for the player about to move, and the resulting 
+column and score are written out as a dict literal keyed by board_key(). 
+Either player may start a game, so boards are generated for both starters.
+
+Rerun this whenever the search or the heuristic changes.
+"""
+
+import os
+import Connect4
+from Connect4 import init_board, init_table, get_valid_locations, lowest_row, make_move, undo_move
+from Connect4 import board_key, search, P1_PIECE, P2_PIECE
+
+# The maximum number of pieces on a board in the book
+BOOK_PIECES = 4
+
+# The depth that the boards in the book are searched to
+BOOK_DEPTH = 5
+
+# The number of entries written on each line of the book
+ENTRIES_PER_LINE = 4
+
+# The book is written next to this script, where Connect4.py imports it from
+BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opening_book.py")
+
+"""
+Adds an entry to the book for this board and the player about to move, then 
+does the same for every board that can follow it, until the boards have 
+BOOK_PIECES pieces.
+"""
+def add_boards(board, player, pieces, book):
+    key = board_key(board, player, True)
+    if not key in book:
+        # Search every board from scratch, just as if it were the first move
+        book[key] = search(board, BOOK_DEPTH, player, init_table())
+    
+    if pieces == BOOK_PIECES:
+        return
+    
+    player_piece = P1_PIECE
+    if player == 1:
+        player_piece = P2_PIECE
+    
+    for col in get_valid_locations(board):
+        row = lowest_row(board, col)
+        make_move(board, player_piece, row, col)
+        add_boards(board, (player + 1) % 2, pieces + 1, book)
+        undo_move(board, player_piece, row, col)
+
+def main():
+    # Don't read from the book that is being replaced
+    Connect4.OPENING_BOOK.clear()
+    
+    book = {}
+    for player in range(2):
+        add_boards(init_board(), player, 0, book)
+    
+    entries = ["%d: (%d, %d)," % (key, column, value) for key, (column, value) in sorted(book.items())]
+    with open(BOOK_PATH, "w") as file:
+        file.write('# -*- coding: utf-8 -*-\n')
+        file.write('"""\n')
+        file.write('The opening book used by the AI, generated by generate_opening_book.py.\n')
+        file.write('\n')
+        file.write('Maps the board_key() of every board with at most %d pieces, for the player \n' % BOOK_PIECES)
+        file.write('about to move, to the best column and its score found by a search to a \n')
+        file.write('depth of BOOK_DEPTH.\n')
+        file.write('"""\n')
+        file.write('\n')
+        file.write('# The depth that the boards in the book were searched to\n')
+        file.write('BOOK_DEPTH = %d\n' % BOOK_DEPTH)
+        file.write('\n')
+        file.write('OPENING_BOOK = {\n')
+        for i in range(0, len(entries), ENTRIES_PER_LINE):
+            file.write('    ' + ' '.join(entries[i:i + ENTRIES_PER_LINE]) + '\n')
+        file.write('}\n')
+    
+    print("Wrote", len(book), "boards to", BOOK_PATH)
+
+if __name__ == "__main__":
+    main()
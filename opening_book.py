@@ -0,0 +1,722 @@
+# -*- coding: utf-8 -*-
+"""
+The opening book used by the AI, generated by generate_opening_book.py.
+
+Maps the board_key() of every board with at most 4 pieces, for the player 
+about to move, to the best column and its score found by a search to a 
+depth of BOOK_DEPTH.
+"""
+
+# The depth that the boards in the book were searched to
+BOOK_DEPTH = 5
+
+OPENING_BOOK = {
+    1: (3, 5), 3: (3, 5), 5: (3, 4), 11: (3, 4),
+    17: (3, 5), 23: (3, 5), 37: (3, 5), 51: (3, 5),
+    81: (4, 6), 103: (4, 6), 513: (3, 4), 521: (1, 5),
+    523: (3, 7), 529: (3, 4), 533: (3, 4), 539: (3, 4),
+    553: (1, 5), 561: (1, 5), 563: (3, 8), 567: (2, 6),
+    1027: (3, 4), 1029: (3, 7), 1031: (1, 5), 1037: (3, 4),
+    1043: (3, 4), 1047: (3, 4), 1057: (2, 6), 1061: (3, 8),
+    1063: (1, 5), 1071: (1, 5), 1545: (1, 3), 1561: (1, 6),
+    1563: (3, 7), 2049: (3, 5), 2053: (1, 3), 2059: (3, 6),
+    2065: (2, 5), 2069: (1, 6), 2071: (3, 7), 2563: (3, 5),
+    2565: (3, 6), 2571: (1, 3), 2577: (3, 7), 2579: (1, 6),
+    2583: (2, 5), 3079: (1, 3), 3085: (3, 7), 3087: (1, 6),
+    4105: (1, 3), 4609: (4, 5), 4617: (4, 7), 4619: (3, 7),
+    5125: (4, 7), 5643: (4, 7), 6147: (4, 5), 6149: (3, 7),
+    6151: (4, 7), 6663: (1, 3), 10241: (3, 9), 12803: (3, 9),
+    65537: (2, 3), 65545: (2, 4), 65547: (3, 9), 65553: (2, 3),
+    65557: (2, 3), 65563: (2, 7), 65577: (2, 5), 65585: (2, 4),
+    65587: (3, 9), 65591: (3, 8), 66057: (0, 4), 66073: (1, 7),
+    66075: (2, 10), 66561: (2, 6), 66563: (1, 6), 66565: (1, 6),
+    66571: (3, 6), 66577: (2, 6), 66579: (1, 7), 66581: (2, 8),
+    66583: (3, 7), 67585: (2, 3), 67593: (2, 4), 67595: (2, 10),
+    68097: (3, 5), 68105: (4, 8), 68107: (3, 7), 68611: (1, 4),
+    68613: (1, 11), 68615: (1, 4), 70657: (1, 7), 71681: (2, 8),
+    71683: (2, 7), 72195: (3, 1000000), 131075: (2, 3), 131077: (3, 9),
+    131079: (2, 4), 131085: (2, 7), 131091: (2, 3), 131095: (2, 3),
+    131105: (3, 8), 131109: (3, 9), 131111: (2, 4), 131119: (2, 5),
+    131585: (1, 6), 131587: (2, 6), 131589: (3, 6), 131595: (1, 6),
+    131601: (3, 7), 131603: (2, 8), 131605: (1, 7), 131607: (2, 6),
+    132103: (0, 4), 132109: (2, 10), 132111: (1, 7), 132609: (1, 4),
+    132617: (1, 4), 132619: (1, 11), 133123: (3, 5), 133125: (3, 7),
+    133127: (4, 8), 133635: (2, 3), 133637: (2, 10), 133639: (2, 4),
+    135169: (3, 1000000), 135681: (2, 7), 135683: (2, 8), 136707: (1, 7),
+    196617: (2, 3), 196633: (2, 6), 196635: (3, 15), 197633: (2, 4),
+    197641: (2, 5), 197643: (2, 12), 199681: (1, 9), 199683: (2, 9),
+    262145: (2, 6), 262149: (2, 5), 262155: (3, 7), 262161: (2, 7),
+    262165: (2, 5), 262167: (2, 9), 262657: (2, 5), 262665: (2, 4),
+    262667: (2, 12), 263171: (3, 8), 263173: (2, 6), 263175: (2, 10),
+    264193: (3, 1000000), 264705: (2, 9), 264707: (2, 9), 327683: (2, 6),
+    327685: (3, 7), 327691: (2, 5), 327697: (2, 9), 327699: (2, 5),
+    327703: (2, 7), 328193: (3, 8), 328201: (2, 10), 328203: (2, 6),
+    328707: (2, 5), 328709: (2, 12), 328711: (2, 4), 329729: (2, 9),
+    329731: (2, 9), 330243: (3, 1000000), 393223: (2, 3), 393229: (3, 15),
+    393231: (2, 6), 393731: (2, 4), 393733: (2, 12), 393735: (2, 5),
+    394753: (2, 9), 394755: (1, 9), 524297: (3, 3), 525313: (3, 1000000),
+    589825: (2, 6), 589833: (2, 6), 589835: (4, 10), 590849: (2, 8),
+    590851: (2, 10), 655365: (3, 11), 655873: (1, 7), 720907: (3, 11),
+    721923: (1, 7), 786435: (2, 6), 786437: (4, 10), 786439: (2, 6),
+    786945: (2, 10), 786947: (2, 8), 851975: (3, 3), 852483: (3, 1000000),
+    1310721: (4, 9), 1638403: (4, 9), 8388609: (3, 3), 8388617: (3, 4),
+    8388619: (4, 11), 8388625: (3, 3), 8388629: (1, 3), 8388635: (3, 9),
+    8388649: (3, 5), 8388657: (3, 4), 8388659: (3, 13), 8388663: (3, 9),
+    8389129: (3, 3), 8389145: (1, 6), 8389147: (3, 11), 8389633: (1, 5),
+    8389635: (4, 9), 8389637: (3, 4), 8389643: (4, 9), 8389649: (3, 5),
+    8389651: (3, 10), 8389653: (3, 7), 8389655: (4, 9), 8390657: (3, 3),
+    8390665: (3, 3), 8390667: (3, 12), 8391169: (2, 4), 8391177: (3, 8),
+    8391179: (3, 11), 8391683: (3, 7), 8391685: (3, 9), 8391687: (1, 7),
+    8393729: (3, 7), 8394753: (3, 6), 8394755: (4, 11), 8395267: (2, 1000000),
+    8454153: (4, 2), 8454169: (4, 4), 8454171: (4, 1000000), 8455169: (2, 4),
+    8455177: (1, 6), 8455179: (3, 12), 8457217: (1, 9), 8457219: (3, 10),
+    8519681: (3, 8), 8519683: (2, 9), 8519685: (3, 7), 8519691: (3, 7),
+    8519697: (3, 8), 8519699: (3, 10), 8519701: (3, 10), 8519703: (2, 7),
+    8520193: (3, 7), 8520201: (3, 7), 8520203: (2, 11), 8520707: (3, 9),
+    8520709: (2, 8), 8520711: (3, 9), 8521729: (3, 6), 8521731: (2, 11),
+    8522241: (2, 12), 8522243: (3, 6), 8650753: (2, 6), 8650761: (2, 9),
+    8650763: (2, 14), 8651777: (2, 4), 8651779: (2, 17), 8716289: (1, 4),
+    8716297: (4, 8), 8716299: (4, 1000000), 8717313: (2, 10), 8717315: (4, 7),
+    8781827: (2, 5), 8781829: (2, 13), 8781831: (2, 8), 8782337: (2, 17),
+    8782339: (2, 5), 9043969: (2, 9), 9175041: (2, 12), 9175043: (2, 11),
+    9240579: (4, 1000000), 16777219: (3, 3), 16777221: (4, 11), 16777223: (3, 4),
+    16777229: (3, 9), 16777235: (1, 3), 16777239: (3, 3), 16777249: (3, 9),
+    16777253: (3, 13), 16777255: (3, 4), 16777263: (3, 5), 16777729: (4, 9),
+    16777731: (1, 5), 16777733: (4, 9), 16777739: (3, 4), 16777745: (4, 9),
+    16777747: (3, 7), 16777749: (3, 10), 16777751: (3, 5), 16778247: (3, 3),
+    16778253: (3, 11), 16778255: (1, 6), 16778753: (3, 7), 16778761: (1, 7),
+    16778763: (3, 9), 16779267: (2, 4), 16779269: (3, 11), 16779271: (3, 8),
+    16779779: (3, 3), 16779781: (3, 12), 16779783: (3, 3), 16781313: (2, 1000000),
+    16781825: (4, 11), 16781827: (3, 6), 16782851: (3, 7), 16842753: (2, 9),
+    16842755: (3, 8), 16842757: (3, 7), 16842763: (3, 7), 16842769: (2, 7),
+    16842771: (3, 10), 16842773: (3, 10), 16842775: (3, 8), 16843265: (3, 9),
+    16843273: (3, 9), 16843275: (2, 8), 16843779: (3, 7), 16843781: (2, 11),
+    16843783: (3, 7), 16844801: (3, 6), 16844803: (2, 12), 16845313: (2, 11),
+    16845315: (3, 6), 16908295: (4, 2), 16908301: (4, 1000000), 16908303: (4, 4),
+    16908803: (2, 4), 16908805: (3, 12), 16908807: (1, 6), 16909825: (3, 10),
+    16909827: (1, 9), 16973825: (2, 5), 16973833: (2, 8), 16973835: (2, 13),
+    16974849: (2, 5), 16974851: (2, 17), 17039363: (1, 4), 17039365: (4, 1000000),
+    17039367: (4, 8), 17039873: (4, 7), 17039875: (2, 10), 17104899: (2, 6),
+    17104901: (2, 14), 17104903: (2, 9), 17105409: (2, 17), 17105411: (2, 4),
+    17301505: (4, 1000000), 17367041: (2, 11), 17367043: (2, 12), 17498115: (2, 9),
+    25165833: (3, 1), 25165849: (3, 3), 25165851: (4, 18), 25166849: (3, 4),
+    25166857: (3, 4), 25166859: (4, 18), 25168897: (3, 7), 25168899: (4, 15),
+    25296897: (3, 5), 25296905: (3, 5), 25296907: (2, 14), 25297921: (1, 5),
+    25297923: (2, 17), 25559041: (2, 10), 25559043: (3, 12), 33554433: (3, 7),
+    33554437: (3, 6), 33554443: (3, 8), 33554449: (2, 8), 33554453: (3, 6),
+    33554455: (4, 10), 33554945: (3, 5), 33554953: (1, 6), 33554955: (4, 12),
+    33555459: (2, 7), 33555461: (3, 9), 33555463: (4, 10), 33556481: (2, 1000000),
+    33556993: (3, 8), 33556995: (4, 8), 33619969: (3, 6), 33619977: (3, 6),
+    33619979: (3, 13), 33620993: (2, 4), 33620995: (2, 15), 33685507: (4, 5),
+    33685509: (4, 1000000), 33685511: (4, 9), 33686017: (3, 6), 33686019: (3, 11),
+    33816577: (4, 1000000), 33882113: (3, 11), 33882115: (3, 11), 41943043: (3, 7),
+    41943045: (3, 8), 41943051: (3, 6), 41943057: (4, 10), 41943059: (3, 6),
+    41943063: (2, 8), 41943553: (2, 7), 41943561: (4, 10), 41943563: (3, 9),
+    41944067: (3, 5), 41944069: (4, 12), 41944071: (1, 6), 41945089: (4, 8),
+    41945091: (3, 8), 41945603: (2, 1000000), 42008577: (4, 5), 42008585: (4, 9),
+    42008587: (4, 1000000), 42009601: (3, 11), 42009603: (3, 6), 42074115: (3, 6),
+    42074117: (3, 13), 42074119: (3, 6), 42074625: (2, 15), 42074627: (2, 4),
+    42205185: (3, 11), 42205187: (3, 11), 42270723: (4, 1000000), 50331655: (3, 1),
+    50331661: (4, 18), 50331663: (3, 3), 50332163: (3, 4), 50332165: (4, 18),
+    50332167: (3, 4), 50333185: (4, 15), 50333187: (3, 7), 50397187: (3, 5),
+    50397189: (2, 14), 50397191: (3, 5), 50397697: (2, 17), 50397699: (1, 5),
+    50528257: (3, 12), 50528259: (2, 10), 67108873: (3, 5), 67109889: (2, 1000000),
+    67239937: (4, 1000000), 75497473: (3, 6), 75497481: (3, 8), 75497483: (4, 10),
+    75498497: (3, 8), 75498499: (5, 10), 75628545: (3, 10), 75628547: (3, 14),
+    83886085: (4, 14), 83886593: (4, 12), 83951617: (3, 10), 92274699: (4, 14),
+    92275715: (4, 12), 92405763: (3, 10), 100663299: (3, 6), 100663301: (4, 10),
+    100663303: (3, 8), 100663809: (5, 10), 100663811: (3, 8), 100728833: (3, 14),
+    100728835: (3, 10), 109051911: (3, 5), 109052419: (2, 1000000), 109117443: (4, 1000000),
+    167772161: (1, 9), 209715203: (1, 9), 1073741825: (4, 3), 1073741833: (2, 5),
+    1073741835: (3, 11), 1073741841: (2, 4), 1073741845: (4, 3), 1073741851: (3, 8),
+    1073741865: (4, 6), 1073741873: (2, 5), 1073741875: (3, 11), 1073741879: (3, 8),
+    1073742345: (0, 3), 1073742361: (1, 6), 1073742363: (4, 10), 1073742849: (4, 6),
+    1073742851: (4, 9), 1073742853: (4, 5), 1073742859: (3, 9), 1073742865: (3, 7),
+    1073742867: (3, 10), 1073742869: (4, 6), 1073742871: (3, 9), 1073743873: (3, 4),
+    1073743881: (3, 6), 1073743883: (3, 11), 1073744385: (3, 4), 1073744393: (3, 6),
+    1073744395: (3, 11), 1073744899: (4, 7), 1073744901: (3, 7), 1073744903: (3, 7),
+    1073746945: (4, 6), 1073747969: (3, 8), 1073747971: (3, 11), 1073748483: (3, 8),
+    1073807369: (3, 2), 1073807385: (3, 4), 1073807387: (3, 1000000), 1073808385: (2, 4),
+    1073808393: (1, 6), 1073808395: (3, 11), 1073810433: (2, 9), 1073810435: (3, 9),
+    1073872897: (2, 6), 1073872899: (2, 6), 1073872901: (4, 4), 1073872907: (3, 5),
+    1073872913: (2, 9), 1073872915: (2, 6), 1073872917: (2, 7), 1073872919: (4, 7),
+    1073873409: (2, 4), 1073873417: (1, 6), 1073873419: (2, 10), 1073873923: (3, 5),
+    1073873925: (2, 8), 1073873927: (1, 8), 1073874945: (3, 7), 1073874947: (0, 8),
+    1073875457: (2, 11), 1073875459: (4, 6), 1074003969: (4, 5), 1074003977: (2, 7),
+    1074003979: (3, 13), 1074004993: (2, 6), 1074004995: (3, 11), 1074069505: (3, 7),
+    1074069513: (3, 8), 1074069515: (3, 1000000), 1074070529: (4, 11), 1074070531: (2, 9),
+    1074135043: (2, 5), 1074135045: (3, 12), 1074135047: (2, 7), 1074135553: (2, 11),
+    1074135555: (2, 7), 1074397185: (4, 8), 1074528257: (4, 7), 1074528259: (4, 10),
+    1074593795: (3, 1000000), 1082130441: (2, 0), 1082130457: (2, 3), 1082130459: (2, 1000000),
+    1082131457: (5, 3), 1082131465: (5, 3), 1082131467: (5, 1000000), 1082133505: (2, 5),
+    1082133507: (5, 1000000), 1082261505: (3, 5), 1082261513: (2, 6), 1082261515: (4, 14),
+    1082262529: (2, 6), 1082262531: (4, 14), 1082523649: (2, 15), 1082523651: (4, 10),
+    1090519041: (4, 9), 1090519043: (3, 8), 1090519045: (4, 9), 1090519051: (3, 5),
+    1090519057: (3, 10), 1090519059: (3, 6), 1090519061: (3, 9), 1090519063: (3, 10),
+    1090519553: (3, 9), 1090519561: (4, 10), 1090519563: (3, 12), 1090520067: (3, 5),
+    1090520069: (4, 11), 1090520071: (4, 10), 1090521089: (4, 9), 1090521091: (3, 9),
+    1090521601: (3, 13), 1090521603: (3, 8), 1090584577: (2, 7), 1090584585: (4, 9),
+    1090584587: (3, 10), 1090585601: (2, 9), 1090585603: (3, 10), 1090650115: (3, 5),
+    1090650117: (2, 12), 1090650119: (4, 10), 1090650625: (3, 10), 1090650627: (3, 10),
+    1090781185: (2, 7), 1090781187: (3, 10), 1090846721: (3, 17), 1090846723: (3, 6),
+    1107296257: (3, 6), 1107296265: (4, 6), 1107296267: (3, 13), 1107297281: (3, 9),
+    1107297283: (4, 11), 1107427329: (3, 8), 1107427331: (4, 11), 1115684865: (2, 5),
+    1115684873: (2, 5), 1115684875: (2, 1000000), 1115685889: (5, 9), 1115685891: (5, 1000000),
+    1115815937: (2, 11), 1115815939: (3, 8), 1124073475: (3, 5), 1124073477: (4, 15),
+    1124073479: (3, 5), 1124073985: (4, 14), 1124073987: (3, 8), 1124139009: (2, 17),
+    1124139011: (3, 4), 1157627905: (3, 10), 1174405121: (3, 14), 1174405123: (3, 10),
+    1182793731: (2, 1000000), 2147483651: (4, 3), 2147483653: (3, 11), 2147483655: (2, 5),
+    2147483661: (3, 8), 2147483667: (4, 3), 2147483671: (2, 4), 2147483681: (3, 8),
+    2147483685: (3, 11), 2147483687: (2, 5), 2147483695: (4, 6), 2147484161: (4, 9),
+    2147484163: (4, 6), 2147484165: (3, 9), 2147484171: (4, 5), 2147484177: (3, 9),
+    2147484179: (4, 6), 2147484181: (3, 10), 2147484183: (3, 7), 2147484679: (0, 3),
+    2147484685: (4, 10), 2147484687: (1, 6), 2147485185: (4, 7), 2147485193: (3, 7),
+    2147485195: (3, 7), 2147485699: (3, 4), 2147485701: (3, 11), 2147485703: (3, 6),
+    2147486211: (3, 4), 2147486213: (3, 11), 2147486215: (3, 6), 2147487745: (3, 8),
+    2147488257: (3, 11), 2147488259: (3, 8), 2147489283: (4, 6), 2147549185: (2, 6),
+    2147549187: (2, 6), 2147549189: (3, 5), 2147549195: (4, 4), 2147549201: (4, 7),
+    2147549203: (2, 7), 2147549205: (2, 6), 2147549207: (2, 9), 2147549697: (3, 5),
+    2147549705: (1, 8), 2147549707: (2, 8), 2147550211: (2, 4), 2147550213: (2, 10),
+    2147550215: (1, 6), 2147551233: (4, 6), 2147551235: (2, 11), 2147551745: (0, 8),
+    2147551747: (3, 7), 2147614727: (3, 2), 2147614733: (3, 1000000), 2147614735: (3, 4),
+    2147615235: (2, 4), 2147615237: (3, 11), 2147615239: (1, 6), 2147616257: (3, 9),
+    2147616259: (2, 9), 2147680257: (2, 5), 2147680265: (2, 7), 2147680267: (3, 12),
+    2147681281: (2, 7), 2147681283: (2, 11), 2147745795: (3, 7), 2147745797: (3, 1000000),
+    2147745799: (3, 8), 2147746305: (2, 9), 2147746307: (4, 11), 2147811331: (4, 5),
+    2147811333: (3, 13), 2147811335: (2, 7), 2147811841: (3, 11), 2147811843: (2, 6),
+    2148007937: (3, 1000000), 2148073473: (4, 10), 2148073475: (4, 7), 2148204547: (4, 8),
+    2155872257: (3, 8), 2155872259: (4, 9), 2155872261: (3, 5), 2155872267: (4, 9),
+    2155872273: (3, 10), 2155872275: (3, 9), 2155872277: (3, 6), 2155872279: (3, 10),
+    2155872769: (3, 5), 2155872777: (4, 10), 2155872779: (4, 11), 2155873283: (3, 9),
+    2155873285: (3, 12), 2155873287: (4, 10), 2155874305: (3, 8), 2155874307: (3, 13),
+    2155874817: (3, 9), 2155874819: (4, 9), 2155937793: (3, 5), 2155937801: (4, 10),
+    2155937803: (2, 12), 2155938817: (3, 10), 2155938819: (3, 10), 2156003331: (2, 7),
+    2156003333: (3, 10), 2156003335: (4, 9), 2156003841: (3, 10), 2156003843: (2, 9),
+    2156134401: (3, 6), 2156134403: (3, 17), 2156199937: (3, 10), 2156199939: (2, 7),
+    2164260871: (2, 0), 2164260877: (2, 1000000), 2164260879: (2, 3), 2164261379: (5, 3),
+    2164261381: (5, 1000000), 2164261383: (5, 3), 2164262401: (5, 1000000), 2164262403: (2, 5),
+    2164326403: (3, 5), 2164326405: (4, 14), 2164326407: (2, 6), 2164326913: (4, 14),
+    2164326915: (2, 6), 2164457473: (4, 10), 2164457475: (2, 15), 2172649473: (3, 5),
+    2172649481: (3, 5), 2172649483: (4, 15), 2172650497: (3, 8), 2172650499: (4, 14),
+    2172780545: (3, 4), 2172780547: (2, 17), 2181038083: (2, 5), 2181038085: (2, 1000000),
+    2181038087: (2, 5), 2181038593: (5, 1000000), 2181038595: (5, 9), 2181103617: (3, 8),
+    2181103619: (2, 11), 2189426691: (3, 6), 2189426693: (3, 13), 2189426695: (4, 6),
+    2189427201: (4, 11), 2189427203: (3, 9), 2189492225: (4, 11), 2189492227: (3, 8),
+    2214592513: (2, 1000000), 2222981121: (3, 10), 2222981123: (3, 14), 2239758339: (3, 10),
+    3221225481: (3, 2), 3221225497: (2, 6), 3221225499: (3, 18), 3221226497: (3, 3),
+    3221226505: (3, 5), 3221226507: (3, 18), 3221228545: (2, 6), 3221228547: (3, 15),
+    3221356545: (4, 5), 3221356553: (2, 7), 3221356555: (3, 14), 3221357569: (4, 9),
+    3221357571: (3, 14), 3221618689: (3, 10), 3221618691: (3, 10), 3238002689: (4, 5),
+    3238002697: (4, 8), 3238002699: (4, 14), 3238003713: (4, 8), 3238003715: (4, 11),
+    3238133761: (2, 10), 3238133763: (4, 15), 3271557121: (3, 12), 3271557123: (4, 10),
+    4294967297: (3, 6), 4294967301: (3, 5), 4294967307: (3, 9), 4294967313: (3, 6),
+    4294967317: (2, 7), 4294967319: (3, 10), 4294967809: (4, 4), 4294967817: (1, 7),
+    4294967819: (3, 11), 4294968323: (3, 8), 4294968325: (3, 9), 4294968327: (3, 10),
+    4294969345: (3, 7), 4294969857: (0, 7), 4294969859: (4, 10), 4295032833: (2, 5),
+    4295032841: (2, 5), 4295032843: (4, 11), 4295033857: (2, 7), 4295033859: (2, 10),
+    4295098371: (3, 7), 4295098373: (3, 1000000), 4295098375: (3, 9), 4295098881: (4, 9),
+    4295098883: (2, 11), 4295229441: (3, 1000000), 4295294977: (4, 7), 4295294979: (2, 7),
+    4303355905: (4, 6), 4303355913: (4, 8), 4303355915: (4, 15), 4303356929: (4, 6),
+    4303356931: (3, 14), 4303486977: (3, 6), 4303486979: (3, 17), 4311744515: (5, 4),
+    4311744517: (2, 1000000), 4311744519: (5, 4), 4311745025: (5, 1000000), 4311745027: (5, 9),
+    4311810049: (2, 7), 4311810051: (3, 10), 4328521729: (2, 1000000), 4336910337: (3, 11),
+    4336910339: (3, 11), 5368709123: (3, 6), 5368709125: (3, 9), 5368709131: (3, 5),
+    5368709137: (3, 10), 5368709139: (2, 7), 5368709143: (3, 6), 5368709633: (3, 8),
+    5368709641: (3, 10), 5368709643: (3, 9), 5368710147: (4, 4), 5368710149: (3, 11),
+    5368710151: (1, 7), 5368711169: (4, 10), 5368711171: (0, 7), 5368711683: (3, 7),
+    5368774657: (3, 7), 5368774665: (3, 9), 5368774667: (3, 1000000), 5368775681: (2, 11),
+    5368775683: (4, 9), 5368840195: (2, 5), 5368840197: (4, 11), 5368840199: (2, 5),
+    5368840705: (2, 10), 5368840707: (2, 7), 5368971265: (2, 7), 5368971267: (4, 7),
+    5369036803: (3, 1000000), 5377097729: (5, 4), 5377097737: (5, 4), 5377097739: (2, 1000000),
+    5377098753: (5, 9), 5377098755: (5, 1000000), 5377228801: (3, 10), 5377228803: (2, 7),
+    5385486339: (4, 6), 5385486341: (4, 15), 5385486343: (4, 8), 5385486849: (3, 14),
+    5385486851: (4, 6), 5385551873: (3, 17), 5385551875: (3, 6), 5402263553: (3, 11),
+    5402263555: (3, 11), 5410652163: (2, 1000000), 6442450951: (3, 2), 6442450957: (3, 18),
+    6442450959: (2, 6), 6442451459: (3, 3), 6442451461: (3, 18), 6442451463: (3, 5),
+    6442452481: (3, 15), 6442452483: (2, 6), 6442516483: (4, 5), 6442516485: (3, 14),
+    6442516487: (2, 7), 6442516993: (3, 14), 6442516995: (4, 9), 6442647553: (3, 10),
+    6442647555: (3, 10), 6450839555: (4, 5), 6450839557: (4, 14), 6450839559: (4, 8),
+    6450840065: (4, 11), 6450840067: (4, 8), 6450905089: (4, 15), 6450905091: (2, 10),
+    6467616769: (4, 10), 6467616771: (3, 12), 8589934601: (4, 4), 8589935617: (1, 5),
+    8590065665: (3, 1000000), 8606711809: (2, 1000000), 9663676417: (4, 6), 9663676425: (4, 7),
+    9663676427: (3, 10), 9663677441: (3, 8), 9663677443: (3, 9), 9663807489: (2, 10),
+    9663807491: (2, 7), 9680453633: (4, 11), 9680453635: (4, 12), 10737418245: (3, 14),
+    10737418753: (3, 12), 10737483777: (2, 8), 10745806849: (4, 9), 11811160075: (3, 14),
+    11811161091: (3, 12), 11811291139: (2, 8), 11827937283: (4, 9), 12884901891: (4, 6),
+    12884901893: (3, 10), 12884901895: (4, 7), 12884902401: (3, 9), 12884902403: (3, 8),
+    12884967425: (2, 7), 12884967427: (2, 10), 12893290497: (4, 12), 12893290499: (4, 11),
+    13958643719: (4, 4), 13958644227: (1, 5), 13958709251: (3, 1000000), 13967032323: (2, 1000000),
+    21474836481: (2, 9), 26843545603: (2, 9), 137438953473: (3, 4), 137438953481: (3, 6),
+    137438953483: (3, 8), 137438953489: (2, 5), 137438953493: (3, 3), 137438953499: (3, 6),
+    137438953513: (2, 6), 137438953521: (3, 5), 137438953523: (3, 8), 137438953527: (3, 6),
+    137438953993: (1, 4), 137438954009: (1, 8), 137438954011: (5, 7), 137438954497: (3, 8),
+    137438954499: (3, 8), 137438954501: (3, 5), 137438954507: (3, 8), 137438954513: (3, 8),
+    137438954515: (3, 8), 137438954517: (3, 6), 137438954519: (4, 8), 137438955521: (3, 5),
+    137438955529: (3, 5), 137438955531: (3, 8), 137438956033: (2, 5), 137438956041: (0, 8),
+    137438956043: (4, 7), 137438956547: (3, 4), 137438956549: (3, 8), 137438956551: (4, 5),
+    137438958593: (2, 9), 137438959617: (3, 8), 137438959619: (3, 8), 137438960131: (5, 6),
+    137439019017: (3, 3), 137439019033: (3, 5), 137439019035: (5, 8), 137439020033: (1, 5),
+    137439020041: (1, 7), 137439020043: (3, 9), 137439022081: (4, 9), 137439022083: (3, 7),
+    137439084545: (2, 9), 137439084547: (2, 6), 137439084549: (3, 6), 137439084555: (3, 5),
+    137439084561: (2, 9), 137439084563: (3, 6), 137439084565: (2, 7), 137439084567: (4, 6),
+    137439085057: (1, 5), 137439085065: (1, 7), 137439085067: (2, 8), 137439085571: (3, 5),
+    137439085573: (2, 11), 137439085575: (4, 6), 137439086593: (3, 1000000), 137439086595: (3, 8),
+    137439087105: (2, 8), 137439087107: (2, 5), 137439215617: (2, 4), 137439215625: (2, 7),
+    137439215627: (3, 13), 137439216641: (3, 1000000), 137439216643: (3, 11), 137439281153: (3, 8),
+    137439281161: (2, 10), 137439281163: (3, 7), 137439282177: (2, 11), 137439282179: (3, 7),
+    137439346691: (3, 3), 137439346693: (3, 13), 137439346695: (2, 6), 137439347201: (2, 10),
+    137439347203: (2, 6), 137439608833: (3, 12), 137439739905: (3, 9), 137439739907: (3, 8),
+    137439805443: (5, 5), 137447342089: (4, 2), 137447342105: (4, 4), 137447342107: (4, 1000000),
+    137447343105: (4, 2), 137447343113: (4, 3), 137447343115: (4, 1000000), 137447345153: (4, 5),
+    137447345155: (4, 1000000), 137447473153: (3, 5), 137447473161: (2, 6), 137447473163: (2, 13),
+    137447474177: (2, 6), 137447474179: (3, 12), 137447735297: (2, 11), 137447735299: (2, 8),
+    137455730689: (2, 9), 137455730691: (3, 5), 137455730693: (2, 6), 137455730699: (5, 3),
+    137455730705: (3, 9), 137455730707: (5, 5), 137455730709: (3, 7), 137455730711: (3, 6),
+    137455731201: (3, 5), 137455731209: (1, 7), 137455731211: (3, 7), 137455731715: (2, 2),
+    137455731717: (3, 11), 137455731719: (3, 5), 137455732737: (2, 1000000), 137455732739: (2, 6),
+    137455733249: (3, 9), 137455733251: (3, 5), 137455796225: (3, 9), 137455796233: (3, 9),
+    137455796235: (3, 11), 137455797249: (2, 10), 137455797251: (3, 8), 137455861763: (1, 3),
+    137455861765: (3, 13), 137455861767: (5, 4), 137455862273: (3, 12), 137455862275: (2, 9),
+    137455992833: (1, 1000000), 137455992835: (1, 9), 137456058369: (3, 14), 137456058371: (2, 6),
+    137472507905: (3, 5), 137472507913: (3, 7), 137472507915: (2, 11), 137472508929: (2, 1000000),
+    137472508931: (2, 8), 137472638977: (1, 1000000), 137472638979: (1, 9), 137480896513: (4, 7),
+    137480896521: (4, 7), 137480896523: (4, 1000000), 137480897537: (4, 8), 137480897539: (4, 1000000),
+    137481027585: (2, 11), 137481027587: (3, 9), 137489285123: (3, 4), 137489285125: (2, 13),
+    137489285127: (3, 4), 137489285633: (2, 12), 137489285635: (3, 6), 137489350657: (2, 14),
+    137489350659: (3, 8), 137522839553: (2, 12), 137539616769: (1, 10), 137539616771: (3, 8),
+    137548005379: (4, 1000000), 138512695305: (3, 3), 138512695321: (3, 6), 138512695323: (3, 1000000),
+    138512696321: (3, 5), 138512696329: (3, 8), 138512696331: (3, 1000000), 138512698369: (3, 9),
+    138512698371: (3, 1000000), 138512826369: (3, 5), 138512826377: (3, 9), 138512826379: (3, 11),
+    138512827393: (3, 10), 138512827395: (3, 10), 138513088513: (3, 14), 138513088515: (2, 9),
+    138529472513: (3, 9), 138529472521: (3, 11), 138529472523: (4, 7), 138529473537: (3, 12),
+    138529473539: (4, 6), 138529603585: (2, 14), 138529603587: (4, 6), 138563026945: (4, 17),
+    138563026947: (5, 5), 139586437121: (5, 6), 139586437123: (4, 6), 139586437125: (4, 6),
+    139586437131: (4, 6), 139586437137: (4, 8), 139586437139: (4, 7), 139586437141: (2, 7),
+    139586437143: (4, 7), 139586437633: (5, 5), 139586437641: (1, 6), 139586437643: (4, 8),
+    139586438147: (5, 5), 139586438149: (4, 9), 139586438151: (5, 5), 139586439169: (3, 9),
+    139586439171: (2, 5), 139586439681: (4, 6), 139586439683: (4, 8), 139586502657: (4, 4),
+    139586502665: (2, 6), 139586502667: (4, 10), 139586503681: (2, 9), 139586503683: (4, 9),
+    139586568195: (4, 4), 139586568197: (4, 11), 139586568199: (4, 4), 139586568705: (2, 7),
+    139586568707: (1, 8), 139586699265: (2, 9), 139586699267: (4, 11), 139586764801: (4, 10),
+    139586764803: (4, 7), 139594825729: (3, 7), 139594825737: (3, 7), 139594825739: (4, 11),
+    139594826753: (3, 8), 139594826755: (4, 10), 139594956801: (3, 10), 139594956803: (4, 9),
+    139603214339: (4, 4), 139603214341: (3, 13), 139603214343: (4, 4), 139603214849: (3, 12),
+    139603214851: (4, 9), 139603279873: (3, 10), 139603279875: (3, 10), 139619991553: (3, 6),
+    139619991555: (3, 11), 139628380161: (4, 15), 139628380163: (4, 4), 141733920769: (4, 5),
+    141733920777: (4, 5), 141733920779: (4, 12), 141733921793: (3, 7), 141733921795: (4, 11),
+    141734051841: (4, 9), 141734051843: (2, 11), 141750697985: (2, 7), 141750697987: (4, 10),
+    142807662593: (3, 8), 142807662601: (3, 10), 142807662603: (3, 1000000), 142807663617: (3, 11),
+    142807663619: (3, 1000000), 142807793665: (3, 11), 142807793667: (2, 6), 142824439809: (4, 17),
+    142824439811: (4, 4), 143881404419: (4, 4), 143881404421: (4, 12), 143881404423: (4, 5),
+    143881404929: (4, 10), 143881404931: (4, 6), 143881469953: (4, 11), 143881469955: (4, 7),
+    143889793025: (4, 17), 143889793027: (4, 5), 148176371713: (5, 7), 150323855361: (4, 10),
+    150323855363: (4, 8), 151397597187: (3, 1000000), 274877906947: (3, 4), 274877906949: (3, 8),
+    274877906951: (3, 6), 274877906957: (3, 6), 274877906963: (3, 3), 274877906967: (2, 5),
+    274877906977: (3, 6), 274877906981: (3, 8), 274877906983: (3, 5), 274877906991: (2, 6),
+    274877907457: (3, 8), 274877907459: (3, 8), 274877907461: (3, 8), 274877907467: (3, 5),
+    274877907473: (4, 8), 274877907475: (3, 6), 274877907477: (3, 8), 274877907479: (3, 8),
+    274877907975: (1, 4), 274877907981: (5, 7), 274877907983: (1, 8), 274877908481: (3, 4),
+    274877908489: (4, 5), 274877908491: (3, 8), 274877908995: (2, 5), 274877908997: (4, 7),
+    274877908999: (0, 8), 274877909507: (3, 5), 274877909509: (3, 8), 274877909511: (3, 5),
+    274877911041: (5, 6), 274877911553: (3, 8), 274877911555: (3, 8), 274877912579: (2, 9),
+    274877972481: (2, 6), 274877972483: (2, 9), 274877972485: (3, 5), 274877972491: (3, 6),
+    274877972497: (4, 6), 274877972499: (2, 7), 274877972501: (3, 6), 274877972503: (2, 9),
+    274877972993: (3, 5), 274877973001: (4, 6), 274877973003: (2, 11), 274877973507: (1, 5),
+    274877973509: (2, 8), 274877973511: (1, 7), 274877974529: (2, 5), 274877974531: (2, 8),
+    274877975041: (3, 8), 274877975043: (3, 1000000), 274878038023: (3, 3), 274878038029: (5, 8),
+    274878038031: (3, 5), 274878038531: (1, 5), 274878038533: (3, 9), 274878038535: (1, 7),
+    274878039553: (3, 7), 274878039555: (4, 9), 274878103553: (3, 3), 274878103561: (2, 6),
+    274878103563: (3, 13), 274878104577: (2, 6), 274878104579: (2, 10), 274878169091: (3, 8),
+    274878169093: (3, 7), 274878169095: (2, 10), 274878169601: (3, 7), 274878169603: (2, 11),
+    274878234627: (2, 4), 274878234629: (3, 13), 274878234631: (2, 7), 274878235137: (3, 11),
+    274878235139: (3, 1000000), 274878431233: (5, 5), 274878496769: (3, 8), 274878496771: (3, 9),
+    274878627843: (3, 12), 274886295553: (3, 5), 274886295555: (2, 9), 274886295557: (5, 3),
+    274886295563: (2, 6), 274886295569: (3, 6), 274886295571: (3, 7), 274886295573: (5, 5),
+    274886295575: (3, 9), 274886296065: (2, 2), 274886296073: (3, 5), 274886296075: (3, 11),
+    274886296579: (3, 5), 274886296581: (3, 7), 274886296583: (1, 7), 274886297601: (3, 5),
+    274886297603: (3, 9), 274886298113: (2, 6), 274886298115: (2, 1000000), 274886361089: (1, 3),
+    274886361097: (5, 4), 274886361099: (3, 13), 274886362113: (2, 9), 274886362115: (3, 12),
+    274886426627: (3, 9), 274886426629: (3, 11), 274886426631: (3, 9), 274886427137: (3, 8),
+    274886427139: (2, 10), 274886557697: (2, 6), 274886557699: (3, 14), 274886623233: (1, 9),
+    274886623235: (1, 1000000), 274894684167: (4, 2), 274894684173: (4, 1000000), 274894684175: (4, 4),
+    274894684675: (4, 2), 274894684677: (4, 1000000), 274894684679: (4, 3), 274894685697: (4, 1000000),
+    274894685699: (4, 5), 274894749699: (3, 5), 274894749701: (2, 13), 274894749703: (2, 6),
+    274894750209: (3, 12), 274894750211: (2, 6), 274894880769: (2, 8), 274894880771: (2, 11),
+    274903072769: (3, 4), 274903072777: (3, 4), 274903072779: (2, 13), 274903073793: (3, 6),
+    274903073795: (2, 12), 274903203841: (3, 8), 274903203843: (2, 14), 274911461379: (4, 7),
+    274911461381: (4, 1000000), 274911461383: (4, 7), 274911461889: (4, 1000000), 274911461891: (4, 8),
+    274911526913: (3, 9), 274911526915: (2, 11), 274919849987: (3, 5), 274919849989: (2, 11),
+    274919849991: (3, 7), 274919850497: (2, 8), 274919850499: (2, 1000000), 274919915521: (1, 9),
+    274919915523: (1, 1000000), 274945015809: (4, 1000000), 274953404417: (3, 8), 274953404419: (1, 10),
+    274970181635: (2, 12), 275951648769: (4, 6), 275951648771: (5, 6), 275951648773: (4, 6),
+    275951648779: (4, 6), 275951648785: (4, 7), 275951648787: (2, 7), 275951648789: (4, 7),
+    275951648791: (4, 8), 275951649281: (5, 5), 275951649289: (5, 5), 275951649291: (4, 9),
+    275951649795: (5, 5), 275951649797: (4, 8), 275951649799: (1, 6), 275951650817: (4, 8),
+    275951650819: (4, 6), 275951651329: (2, 5), 275951651331: (3, 9), 275951714305: (4, 4),
+    275951714313: (4, 4), 275951714315: (4, 11), 275951715329: (1, 8), 275951715331: (2, 7),
+    275951779843: (4, 4), 275951779845: (4, 10), 275951779847: (2, 6), 275951780353: (4, 9),
+    275951780355: (2, 9), 275951910913: (4, 7), 275951910915: (4, 10), 275951976449: (4, 11),
+    275951976451: (2, 9), 275960037377: (4, 4), 275960037385: (4, 4), 275960037387: (3, 13),
+    275960038401: (4, 9), 275960038403: (3, 12), 275960168449: (3, 10), 275960168451: (3, 10),
+    275968425987: (3, 7), 275968425989: (4, 11), 275968425991: (3, 7), 275968426497: (4, 10),
+    275968426499: (3, 8), 275968491521: (4, 9), 275968491523: (3, 10), 275985203201: (4, 4),
+    275985203203: (4, 15), 275993591809: (3, 11), 275993591811: (3, 6), 277025390599: (3, 3),
+    277025390605: (3, 1000000), 277025390607: (3, 6), 277025391107: (3, 5), 277025391109: (3, 1000000),
+    277025391111: (3, 8), 277025392129: (3, 1000000), 277025392131: (3, 9), 277025456131: (3, 5),
+    277025456133: (3, 11), 277025456135: (3, 9), 277025456641: (3, 10), 277025456643: (3, 10),
+    277025587201: (2, 9), 277025587203: (3, 14), 277033779203: (3, 9), 277033779205: (4, 7),
+    277033779207: (3, 11), 277033779713: (4, 6), 277033779715: (3, 12), 277033844737: (4, 6),
+    277033844739: (2, 14), 277050556417: (5, 5), 277050556419: (4, 17), 278099132417: (4, 4),
+    278099132425: (4, 5), 278099132427: (4, 12), 278099133441: (4, 6), 278099133443: (4, 10),
+    278099263489: (4, 7), 278099263491: (4, 11), 278115909633: (4, 5), 278115909635: (4, 17),
+    279172874243: (3, 8), 279172874245: (3, 1000000), 279172874247: (3, 10), 279172874753: (3, 1000000),
+    279172874755: (3, 11), 279172939777: (2, 6), 279172939779: (3, 11), 279181262849: (4, 4),
+    279181262851: (4, 17), 280246616067: (4, 5), 280246616069: (4, 12), 280246616071: (4, 5),
+    280246616577: (4, 11), 280246616579: (3, 7), 280246681601: (2, 11), 280246681603: (4, 9),
+    280255004673: (4, 10), 280255004675: (2, 7), 283467841537: (3, 1000000), 284541583361: (4, 8),
+    284541583363: (4, 10), 286689067011: (5, 7), 412316860425: (3, 3), 412316860441: (2, 7),
+    412316860443: (3, 11), 412316861441: (3, 4), 412316861449: (3, 7), 412316861451: (3, 13),
+    412316863489: (2, 11), 412316863491: (4, 11), 412316991489: (2, 7), 412316991497: (2, 9),
+    412316991499: (3, 9), 412316992513: (3, 1000000), 412316992515: (3, 9), 412317253633: (3, 15),
+    412317253635: (4, 6), 412333637633: (3, 7), 412333637641: (3, 8), 412333637643: (3, 7),
+    412333638657: (2, 1000000), 412333638659: (2, 5), 412333768705: (1, 1000000), 412333768707: (4, 5),
+    412367192065: (2, 15), 412367192067: (3, 7), 414464344065: (5, 4), 414464344073: (3, 6),
+    414464344075: (4, 11), 414464345089: (3, 7), 414464345091: (2, 9), 414464475137: (3, 9),
+    414464475139: (4, 9), 414481121281: (3, 10), 414481121283: (5, 9), 418759311361: (4, 9),
+    418759311363: (5, 9), 549755813889: (3, 5), 549755813893: (3, 5), 549755813899: (3, 6),
+    549755813905: (3, 7), 549755813909: (3, 7), 549755813911: (3, 7), 549755814401: (3, 5),
+    549755814409: (1, 7), 549755814411: (3, 8), 549755814915: (4, 5), 549755814917: (1, 6),
+    549755814919: (4, 6), 549755815937: (3, 7), 549755816449: (3, 8), 549755816451: (3, 8),
+    549755879425: (3, 4), 549755879433: (3, 5), 549755879435: (4, 9), 549755880449: (2, 8),
+    549755880451: (2, 6), 549755944963: (3, 4), 549755944965: (3, 9), 549755944967: (4, 5),
+    549755945473: (3, 9), 549755945475: (4, 5), 549756076033: (3, 7), 549756141569: (2, 10),
+    549756141571: (6, 7), 549764202497: (3, 3), 549764202505: (3, 4), 549764202507: (3, 9),
+    549764203521: (3, 5), 549764203523: (3, 9), 549764333569: (3, 8), 549764333571: (3, 13),
+    549772591107: (4, 4), 549772591109: (4, 1000000), 549772591111: (4, 5), 549772591617: (4, 1000000),
+    549772591619: (4, 6), 549772656641: (2, 9), 549772656643: (3, 9), 549789368321: (4, 1000000),
+    549797756929: (2, 8), 549797756931: (3, 8), 550829555713: (4, 3), 550829555721: (4, 5),
+    550829555723: (4, 9), 550829556737: (4, 5), 550829556739: (4, 8), 550829686785: (2, 6),
+    550829686787: (4, 11), 550846332929: (3, 6), 550846332931: (4, 12), 551903297539: (3, 5),
+    551903297541: (3, 1000000), 551903297543: (3, 6), 551903298049: (3, 1000000), 551903298051: (3, 8),
+    551903363073: (3, 7), 551903363075: (6, 8), 551911686145: (3, 6), 551911686147: (4, 11),
+    554050781185: (3, 1000000), 555124523009: (4, 9), 555124523011: (4, 9), 687194767363: (3, 5),
+    687194767365: (3, 6), 687194767371: (3, 5), 687194767377: (3, 7), 687194767379: (3, 7),
+    687194767383: (3, 7), 687194767873: (4, 5), 687194767881: (4, 6), 687194767883: (1, 6),
+    687194768387: (3, 5), 687194768389: (3, 8), 687194768391: (1, 7), 687194769409: (3, 8),
+    687194769411: (3, 8), 687194769923: (3, 7), 687194832897: (3, 4), 687194832905: (4, 5),
+    687194832907: (3, 9), 687194833921: (4, 5), 687194833923: (3, 9), 687194898435: (3, 4),
+    687194898437: (4, 9), 687194898439: (3, 5), 687194898945: (2, 6), 687194898947: (2, 8),
+    687195029505: (6, 7), 687195029507: (2, 10), 687195095043: (3, 7), 687203155969: (4, 4),
+    687203155977: (4, 5), 687203155979: (4, 1000000), 687203156993: (4, 6), 687203156995: (4, 1000000),
+    687203287041: (3, 9), 687203287043: (2, 9), 687211544579: (3, 3), 687211544581: (3, 9),
+    687211544583: (3, 4), 687211545089: (3, 9), 687211545091: (3, 5), 687211610113: (3, 13),
+    687211610115: (3, 8), 687228321793: (3, 8), 687228321795: (2, 8), 687236710403: (4, 1000000),
+    688268509185: (3, 5), 688268509193: (3, 6), 688268509195: (3, 1000000), 688268510209: (3, 8),
+    688268510211: (3, 1000000), 688268640257: (6, 8), 688268640259: (3, 7), 688285286401: (4, 11),
+    688285286403: (3, 6), 689342251011: (4, 3), 689342251013: (4, 9), 689342251015: (4, 5),
+    689342251521: (4, 8), 689342251523: (4, 5), 689342316545: (4, 11), 689342316547: (2, 6),
+    689350639617: (4, 12), 689350639619: (3, 6), 691489734657: (4, 9), 691489734659: (4, 9),
+    692563476483: (3, 1000000), 824633720839: (3, 3), 824633720845: (3, 11), 824633720847: (2, 7),
+    824633721347: (3, 4), 824633721349: (3, 13), 824633721351: (3, 7), 824633722369: (4, 11),
+    824633722371: (2, 11), 824633786371: (2, 7), 824633786373: (3, 9), 824633786375: (2, 9),
+    824633786881: (3, 9), 824633786883: (3, 1000000), 824633917441: (4, 6), 824633917443: (3, 15),
+    824642109443: (3, 7), 824642109445: (3, 7), 824642109447: (3, 8), 824642109953: (2, 5),
+    824642109955: (2, 1000000), 824642174977: (4, 5), 824642174979: (1, 1000000), 824658886657: (3, 7),
+    824658886659: (2, 15), 825707462659: (5, 4), 825707462661: (4, 11), 825707462663: (3, 6),
+    825707463169: (2, 9), 825707463171: (3, 7), 825707528193: (4, 9), 825707528195: (3, 9),
+    825715851265: (5, 9), 825715851267: (3, 10), 827854946305: (5, 9), 827854946307: (4, 9),
+    1099511627785: (3, 4), 1099511628801: (1, 6), 1099511758849: (3, 8), 1099528404993: (4, 1000000),
+    1101659111425: (3, 1000000), 1236950581249: (2, 5), 1236950581257: (3, 7), 1236950581259: (3, 9),
+    1236950582273: (3, 8), 1236950582275: (3, 8), 1236950712321: (3, 11), 1236950712323: (3, 8),
+    1236967358465: (2, 11), 1236967358467: (3, 6), 1239098064897: (2, 7), 1239098064899: (4, 8),
+    1374389534725: (3, 10), 1374389535233: (4, 9), 1374389600257: (2, 6), 1374397923329: (3, 7),
+    1375463276545: (5, 7), 1511828488203: (3, 10), 1511828489219: (4, 9), 1511828619267: (2, 6),
+    1511845265411: (3, 7), 1513975971843: (5, 7), 1649267441667: (2, 5), 1649267441669: (3, 9),
+    1649267441671: (3, 7), 1649267442177: (3, 8), 1649267442179: (3, 8), 1649267507201: (3, 8),
+    1649267507203: (3, 11), 1649275830273: (3, 6), 1649275830275: (2, 11), 1650341183489: (4, 8),
+    1650341183491: (2, 7), 1786706395143: (3, 4), 1786706395651: (1, 6), 1786706460675: (3, 8),
+    1786714783747: (4, 1000000), 1787780136963: (3, 1000000), 2748779069441: (3, 9), 3435973836803: (3, 9),
+    17592186044417: (3, 4), 17592186044425: (3, 6), 17592186044427: (3, 6), 17592186044433: (3, 5),
+    17592186044437: (3, 4), 17592186044443: (3, 4), 17592186044457: (3, 6), 17592186044465: (3, 5),
+    17592186044467: (3, 6), 17592186044471: (3, 6), 17592186044937: (1, 4), 17592186044953: (1, 8),
+    17592186044955: (3, 4), 17592186045441: (3, 8), 17592186045443: (3, 6), 17592186045445: (3, 6),
+    17592186045451: (3, 5), 17592186045457: (3, 8), 17592186045459: (3, 6), 17592186045461: (1, 8),
+    17592186045463: (3, 5), 17592186046465: (3, 5), 17592186046473: (3, 5), 17592186046475: (3, 8),
+    17592186046977: (3, 6), 17592186046985: (0, 8), 17592186046987: (3, 5), 17592186047491: (3, 3),
+    17592186047493: (2, 10), 17592186047495: (3, 4), 17592186049537: (3, 10), 17592186050561: (3, 9),
+    17592186050563: (3, 7), 17592186051075: (3, 4), 17592186109961: (0, 3), 17592186109977: (2, 7),
+    17592186109979: (3, 7), 17592186110977: (2, 6), 17592186110985: (1, 9), 17592186110987: (3, 8),
+    17592186113025: (2, 11), 17592186113027: (3, 6), 17592186175489: (3, 11), 17592186175491: (4, 5),
+    17592186175493: (3, 9), 17592186175499: (3, 4), 17592186175505: (2, 11), 17592186175507: (3, 4),
+    17592186175509: (3, 9), 17592186175511: (4, 5), 17592186176001: (2, 6), 17592186176009: (1, 7),
+    17592186176011: (2, 7), 17592186176515: (3, 3), 17592186176517: (2, 11), 17592186176519: (4, 5),
+    17592186177537: (3, 1000000), 17592186177539: (3, 6), 17592186178049: (2, 9), 17592186178051: (2, 5),
+    17592186306561: (3, 5), 17592186306569: (2, 7), 17592186306571: (3, 10), 17592186307585: (3, 1000000),
+    17592186307587: (3, 10), 17592186372097: (3, 9), 17592186372105: (2, 11), 17592186372107: (6, 6),
+    17592186373121: (2, 12), 17592186373123: (2, 5), 17592186437635: (3, 2), 17592186437637: (3, 18),
+    17592186437639: (2, 3), 17592186438145: (2, 12), 17592186438147: (2, 5), 17592186699777: (3, 14),
+    17592186830849: (3, 10), 17592186830851: (2, 7), 17592186896387: (2, 4), 17592194433033: (3, 2),
+    17592194433049: (3, 6), 17592194433051: (3, 10), 17592194434049: (1, 3), 17592194434057: (1, 5),
+    17592194434059: (3, 9), 17592194436097: (3, 7), 17592194436099: (3, 8), 17592194564097: (3, 5),
+    17592194564105: (2, 7), 17592194564107: (3, 12), 17592194565121: (2, 7), 17592194565123: (3, 11),
+    17592194826241: (2, 14), 17592194826243: (2, 8), 17592202821633: (2, 11), 17592202821635: (3, 4),
+    17592202821637: (3, 11), 17592202821643: (3, 2), 17592202821649: (2, 11), 17592202821651: (1, 3),
+    17592202821653: (3, 12), 17592202821655: (3, 4), 17592202822145: (3, 6), 17592202822153: (1, 8),
+    17592202822155: (3, 5), 17592202822659: (2, 2), 17592202822661: (3, 11), 17592202822663: (3, 4),
+    17592202823681: (2, 1000000), 17592202823683: (2, 5), 17592202824193: (3, 9), 17592202824195: (3, 4),
+    17592202887169: (2, 9), 17592202887177: (3, 10), 17592202887179: (3, 9), 17592202888193: (2, 11),
+    17592202888195: (3, 7), 17592202952707: (4, 0), 17592202952709: (4, 1000000), 17592202952711: (4, 3),
+    17592202953217: (3, 13), 17592202953219: (2, 4), 17592203083777: (4, 1000000), 17592203083779: (1, 4),
+    17592203149313: (2, 15), 17592203149315: (2, 8), 17592219598849: (3, 6), 17592219598857: (3, 7),
+    17592219598859: (3, 10), 17592219599873: (2, 1000000), 17592219599875: (2, 7), 17592219729921: (4, 1000000),
+    17592219729923: (4, 5), 17592227987457: (3, 8), 17592227987465: (3, 10), 17592227987467: (3, 7),
+    17592227988481: (4, 11), 17592227988483: (3, 7), 17592228118529: (3, 13), 17592228118531: (2, 6),
+    17592236376067: (3, 1), 17592236376069: (2, 18), 17592236376071: (3, 3), 17592236376577: (4, 13),
+    17592236376579: (3, 4), 17592236441601: (2, 15), 17592236441603: (3, 5), 17592269930497: (2, 14),
+    17592286707713: (2, 10), 17592286707715: (3, 8), 17592295096323: (3, 5), 17593259786249: (3, 4),
+    17593259786265: (3, 7), 17593259786267: (3, 10), 17593259787265: (3, 5), 17593259787273: (3, 8),
+    17593259787275: (3, 9), 17593259789313: (3, 9), 17593259789315: (4, 9), 17593259917313: (3, 5),
+    17593259917321: (3, 9), 17593259917323: (3, 9), 17593259918337: (3, 11), 17593259918339: (3, 9),
+    17593260179457: (3, 14), 17593260179459: (4, 7), 17593276563457: (3, 7), 17593276563465: (3, 12),
+    17593276563467: (4, 7), 17593276564481: (4, 13), 17593276564483: (4, 6), 17593276694529: (2, 14),
+    17593276694531: (4, 6), 17593310117889: (4, 14), 17593310117891: (3, 5), 17594333528065: (3, 9),
+    17594333528067: (2, 4), 17594333528069: (3, 9), 17594333528075: (6, 3), 17594333528081: (3, 9),
+    17594333528083: (2, 4), 17594333528085: (3, 9), 17594333528087: (2, 4), 17594333528577: (3, 6),
+    17594333528585: (1, 7), 17594333528587: (3, 5), 17594333529091: (3, 3), 17594333529093: (4, 10),
+    17594333529095: (0, 4), 17594333530113: (3, 9), 17594333530115: (2, 5), 17594333530625: (2, 9),
+    17594333530627: (3, 5), 17594333593601: (2, 4), 17594333593609: (2, 7), 17594333593611: (4, 7),
+    17594333594625: (2, 10), 17594333594627: (4, 6), 17594333659139: (3, 2), 17594333659141: (3, 1000000),
+    17594333659143: (3, 4), 17594333659649: (2, 11), 17594333659651: (2, 4), 17594333790209: (3, 1000000),
+    17594333790211: (3, 9), 17594333855745: (2, 11), 17594333855747: (4, 5), 17594341916673: (3, 7),
+    17594341916681: (3, 9), 17594341916683: (3, 10), 17594341917697: (3, 11), 17594341917699: (3, 9),
+    17594342047745: (3, 10), 17594342047747: (2, 9), 17594350305283: (2, 2), 17594350305285: (2, 1000000),
+    17594350305287: (2, 3), 17594350305793: (3, 13), 17594350305795: (1, 4), 17594350370817: (4, 12),
+    17594350370819: (2, 10), 17594367082497: (2, 1000000), 17594367082499: (2, 9), 17594375471105: (3, 13),
+    17594375471107: (3, 6), 17596481011713: (4, 5), 17596481011721: (0, 6), 17596481011723: (4, 11),
+    17596481012737: (3, 7), 17596481012739: (4, 10), 17596481142785: (3, 1000000), 17596481142787: (3, 8),
+    17596497788929: (2, 1000000), 17596497788931: (2, 8), 17597554753537: (3, 7), 17597554753545: (3, 10),
+    17597554753547: (4, 7), 17597554754561: (3, 13), 17597554754563: (4, 7), 17597554884609: (3, 13),
+    17597554884611: (4, 7), 17597571530753: (4, 14), 17597571530755: (4, 9), 17598628495363: (4, 3),
+    17598628495365: (3, 18), 17598628495367: (2, 3), 17598628495873: (3, 13), 17598628495875: (4, 6),
+    17598628560897: (3, 12), 17598628560899: (4, 7), 17598636883969: (4, 13), 17598636883971: (4, 8),
+    17602923462657: (3, 11), 17605070946305: (2, 10), 17605070946307: (4, 6), 17606144688131: (3, 3),
+    17729624997897: (3, 5), 17729624997913: (3, 7), 17729624997915: (5, 8), 17729624998913: (3, 8),
+    17729624998921: (3, 8), 17729624998923: (3, 8), 17729625000961: (3, 13), 17729625000963: (3, 7),
+    17729625128961: (3, 9), 17729625128969: (3, 9), 17729625128971: (3, 8), 17729625129985: (3, 1000000),
+    17729625129987: (3, 8), 17729625391105: (3, 18), 17729625391107: (3, 5), 17729641775105: (2, 9),
+    17729641775113: (3, 9), 17729641775115: (5, 5), 17729641776129: (2, 1000000), 17729641776131: (2, 3),
+    17729641906177: (1, 1000000), 17729641906179: (1, 3), 17729675329537: (2, 18), 17729675329539: (3, 4),
+    17731772481537: (3, 6), 17731772481545: (3, 8), 17731772481547: (5, 9), 17731772482561: (3, 9),
+    17731772482563: (5, 7), 17731772612609: (3, 11), 17731772612611: (5, 6), 17731789258753: (3, 12),
+    17731789258755: (5, 6), 17736067448833: (4, 12), 17736067448835: (4, 5), 17867063951361: (3, 7),
+    17867063951363: (5, 5), 17867063951365: (3, 6), 17867063951371: (5, 4), 17867063951377: (4, 7),
+    17867063951379: (5, 6), 17867063951381: (3, 7), 17867063951383: (5, 6), 17867063951873: (3, 5),
+    17867063951881: (1, 6), 17867063951883: (5, 6), 17867063952387: (5, 4), 17867063952389: (3, 8),
+    17867063952391: (1, 6), 17867063953409: (5, 6), 17867063953411: (2, 6), 17867063953921: (3, 8),
+    17867063953923: (5, 7), 17867064016897: (2, 5), 17867064016905: (3, 5), 17867064016907: (5, 7),
+    17867064017921: (2, 8), 17867064017923: (5, 6), 17867064082435: (6, 3), 17867064082437: (2, 10),
+    17867064082439: (6, 4), 17867064082945: (2, 9), 17867064082947: (1, 5), 17867064213505: (3, 9),
+    17867064213507: (3, 10), 17867064279041: (3, 11), 17867064279043: (5, 7), 17867072339969: (3, 4),
+    17867072339977: (3, 5), 17867072339979: (5, 8), 17867072340993: (3, 7), 17867072340995: (5, 7),
+    17867072471041: (3, 12), 17867072471043: (2, 10), 17867080728579: (3, 3), 17867080728581: (3, 11),
+    17867080728583: (3, 4), 17867080729089: (3, 11), 17867080729091: (3, 5), 17867080794113: (2, 11),
+    17867080794115: (2, 10), 17867097505793: (3, 9), 17867097505795: (2, 10), 17867105894401: (2, 12),
+    17867105894403: (5, 6), 17868137693185: (5, 6), 17868137693193: (4, 7), 17868137693195: (5, 7),
+    17868137694209: (4, 8), 17868137694211: (5, 7), 17868137824257: (4, 10), 17868137824259: (5, 6),
+    17868154470401: (4, 11), 17868154470403: (3, 7), 17869211435011: (6, 4), 17869211435013: (4, 11),
+    17869211435015: (2, 5), 17869211435521: (4, 11), 17869211435523: (2, 6), 17869211500545: (4, 8),
+    17869211500547: (5, 8), 17869219823617: (4, 8), 17869219823619: (3, 9), 17871358918657: (4, 6),
+    17871358918659: (4, 10), 17872432660481: (4, 12), 17872432660483: (4, 4), 18141941858305: (5, 3),
+    18141941858313: (3, 5), 18141941858315: (6, 8), 18141941859329: (2, 7), 18141941859331: (6, 8),
+    18141941989377: (3, 11), 18141941989379: (3, 6), 18141958635521: (3, 11), 18141958635523: (3, 8),
+    18144089341953: (3, 7), 18144089341955: (2, 8), 18279380811777: (3, 6), 18279380811785: (3, 8),
+    18279380811787: (3, 5), 18279380812801: (3, 8), 18279380812803: (3, 5), 18279380942849: (3, 11),
+    18279380942851: (3, 6), 18279397588993: (3, 12), 18279397588995: (3, 3), 18281528295425: (4, 10),
+    18281528295427: (4, 4), 18416819765251: (5, 3), 18416819765253: (4, 10), 18416819765255: (3, 4),
+    18416819765761: (3, 8), 18416819765763: (2, 5), 18416819830785: (3, 7), 18416819830787: (3, 7),
+    18416828153857: (3, 9), 18416828153859: (5, 7), 18417893507073: (5, 11), 18417893507075: (5, 4),
+    18966575579137: (2, 7), 19241453486081: (3, 7), 19241453486083: (2, 7), 19378892439555: (5, 3),
+    35184372088835: (3, 4), 35184372088837: (3, 6), 35184372088839: (3, 6), 35184372088845: (3, 4),
+    35184372088851: (3, 4), 35184372088855: (3, 5), 35184372088865: (3, 6), 35184372088869: (3, 6),
+    35184372088871: (3, 5), 35184372088879: (3, 6), 35184372089345: (3, 6), 35184372089347: (3, 8),
+    35184372089349: (3, 5), 35184372089355: (3, 6), 35184372089361: (3, 5), 35184372089363: (1, 8),
+    35184372089365: (3, 6), 35184372089367: (3, 8), 35184372089863: (1, 4), 35184372089869: (3, 4),
+    35184372089871: (1, 8), 35184372090369: (3, 3), 35184372090377: (3, 4), 35184372090379: (2, 10),
+    35184372090883: (3, 6), 35184372090885: (3, 5), 35184372090887: (0, 8), 35184372091395: (3, 5),
+    35184372091397: (3, 8), 35184372091399: (3, 5), 35184372092929: (3, 4), 35184372093441: (3, 7),
+    35184372093443: (3, 9), 35184372094467: (3, 10), 35184372154369: (4, 5), 35184372154371: (3, 11),
+    35184372154373: (3, 4), 35184372154379: (3, 9), 35184372154385: (4, 5), 35184372154387: (3, 9),
+    35184372154389: (3, 4), 35184372154391: (2, 11), 35184372154881: (3, 3), 35184372154889: (4, 5),
+    35184372154891: (2, 11), 35184372155395: (2, 6), 35184372155397: (2, 7), 35184372155399: (1, 7),
+    35184372156417: (2, 5), 35184372156419: (2, 9), 35184372156929: (3, 6), 35184372156931: (3, 1000000),
+    35184372219911: (0, 3), 35184372219917: (3, 7), 35184372219919: (2, 7), 35184372220419: (2, 6),
+    35184372220421: (3, 8), 35184372220423: (1, 9), 35184372221441: (3, 6), 35184372221443: (2, 11),
+    35184372285441: (3, 2), 35184372285449: (2, 3), 35184372285451: (3, 18), 35184372286465: (2, 5),
+    35184372286467: (2, 12), 35184372350979: (3, 9), 35184372350981: (6, 6), 35184372350983: (2, 11),
+    35184372351489: (2, 5), 35184372351491: (2, 12), 35184372416515: (3, 5), 35184372416517: (3, 10),
+    35184372416519: (2, 7), 35184372417025: (3, 10), 35184372417027: (3, 1000000), 35184372613121: (2, 4),
+    35184372678657: (2, 7), 35184372678659: (3, 10), 35184372809731: (3, 14), 35184380477441: (3, 4),
+    35184380477443: (2, 11), 35184380477445: (3, 2), 35184380477451: (3, 11), 35184380477457: (3, 4),
+    35184380477459: (3, 12), 35184380477461: (1, 3), 35184380477463: (2, 11), 35184380477953: (2, 2),
+    35184380477961: (3, 4), 35184380477963: (3, 11), 35184380478467: (3, 6), 35184380478469: (3, 5),
+    35184380478471: (1, 8), 35184380479489: (3, 4), 35184380479491: (3, 9), 35184380480001: (2, 5),
+    35184380480003: (2, 1000000), 35184380542977: (4, 0), 35184380542985: (4, 3), 35184380542987: (4, 1000000),
+    35184380544001: (2, 4), 35184380544003: (3, 13), 35184380608515: (2, 9), 35184380608517: (3, 9),
+    35184380608519: (3, 10), 35184380609025: (3, 7), 35184380609027: (2, 11), 35184380739585: (2, 8),
+    35184380739587: (2, 15), 35184380805121: (1, 4), 35184380805123: (4, 1000000), 35184388866055: (3, 2),
+    35184388866061: (3, 10), 35184388866063: (3, 6), 35184388866563: (1, 3), 35184388866565: (3, 9),
+    35184388866567: (1, 5), 35184388867585: (3, 8), 35184388867587: (3, 7), 35184388931587: (3, 5),
+    35184388931589: (3, 12), 35184388931591: (2, 7), 35184388932097: (3, 11), 35184388932099: (2, 7),
+    35184389062657: (2, 8), 35184389062659: (2, 14), 35184397254657: (3, 1), 35184397254665: (3, 3),
+    35184397254667: (2, 18), 35184397255681: (3, 4), 35184397255683: (4, 13), 35184397385729: (3, 5),
+    35184397385731: (2, 15), 35184405643267: (3, 8), 35184405643269: (3, 7), 35184405643271: (3, 10),
+    35184405643777: (3, 7), 35184405643779: (4, 11), 35184405708801: (2, 6), 35184405708803: (3, 13),
+    35184414031875: (3, 6), 35184414031877: (3, 10), 35184414031879: (3, 7), 35184414032385: (2, 7),
+    35184414032387: (2, 1000000), 35184414097409: (4, 5), 35184414097411: (4, 1000000), 35184439197697: (3, 5),
+    35184447586305: (3, 8), 35184447586307: (2, 10), 35184464363523: (2, 14), 35185445830657: (2, 4),
+    35185445830659: (3, 9), 35185445830661: (6, 3), 35185445830667: (3, 9), 35185445830673: (2, 4),
+    35185445830675: (3, 9), 35185445830677: (2, 4), 35185445830679: (3, 9), 35185445831169: (3, 3),
+    35185445831177: (0, 4), 35185445831179: (4, 10), 35185445831683: (3, 6), 35185445831685: (3, 5),
+    35185445831687: (1, 7), 35185445832705: (3, 5), 35185445832707: (2, 9), 35185445833217: (2, 5),
+    35185445833219: (3, 9), 35185445896193: (3, 2), 35185445896201: (3, 4), 35185445896203: (3, 1000000),
+    35185445897217: (2, 4), 35185445897219: (2, 11), 35185445961731: (2, 4), 35185445961733: (4, 7),
+    35185445961735: (2, 7), 35185445962241: (4, 6), 35185445962243: (2, 10), 35185446092801: (4, 5),
+    35185446092803: (2, 11), 35185446158337: (3, 9), 35185446158339: (3, 1000000), 35185454219265: (2, 2),
+    35185454219273: (2, 3), 35185454219275: (2, 1000000), 35185454220289: (1, 4), 35185454220291: (3, 13),
+    35185454350337: (2, 10), 35185454350339: (4, 12), 35185462607875: (3, 7), 35185462607877: (3, 10),
+    35185462607879: (3, 9), 35185462608385: (3, 9), 35185462608387: (3, 11), 35185462673409: (2, 9),
+    35185462673411: (3, 10), 35185479385089: (3, 6), 35185479385091: (3, 13), 35185487773697: (2, 9),
+    35185487773699: (2, 1000000), 35186519572487: (3, 4), 35186519572493: (3, 10), 35186519572495: (3, 7),
+    35186519572995: (3, 5), 35186519572997: (3, 9), 35186519572999: (3, 8), 35186519574017: (4, 9),
+    35186519574019: (3, 9), 35186519638019: (3, 5), 35186519638021: (3, 9), 35186519638023: (3, 9),
+    35186519638529: (3, 9), 35186519638531: (3, 11), 35186519769089: (4, 7), 35186519769091: (3, 14),
+    35186527961091: (3, 7), 35186527961093: (4, 7), 35186527961095: (3, 12), 35186527961601: (4, 6),
+    35186527961603: (4, 13), 35186528026625: (4, 6), 35186528026627: (2, 14), 35186544738305: (3, 5),
+    35186544738307: (4, 14), 35187593314305: (4, 3), 35187593314313: (2, 3), 35187593314315: (3, 18),
+    35187593315329: (4, 6), 35187593315331: (3, 13), 35187593445377: (4, 7), 35187593445379: (3, 12),
+    35187610091521: (4, 8), 35187610091523: (4, 13), 35188667056131: (3, 7), 35188667056133: (4, 7),
+    35188667056135: (3, 10), 35188667056641: (4, 7), 35188667056643: (3, 13), 35188667121665: (4, 7),
+    35188667121667: (3, 13), 35188675444737: (4, 9), 35188675444739: (4, 14), 35189740797955: (4, 5),
+    35189740797957: (4, 11), 35189740797959: (0, 6), 35189740798465: (4, 10), 35189740798467: (3, 7),
+    35189740863489: (3, 8), 35189740863491: (3, 1000000), 35189749186561: (2, 8), 35189749186563: (2, 1000000),
+    35192962023425: (3, 3), 35194035765249: (4, 6), 35194035765251: (2, 10), 35196183248899: (3, 11),
+    35321811042305: (5, 5), 35321811042307: (3, 7), 35321811042309: (5, 4), 35321811042315: (3, 6),
+    35321811042321: (5, 6), 35321811042323: (3, 7), 35321811042325: (5, 6), 35321811042327: (4, 7),
+    35321811042817: (5, 4), 35321811042825: (1, 6), 35321811042827: (3, 8), 35321811043331: (3, 5),
+    35321811043333: (5, 6), 35321811043335: (1, 6), 35321811044353: (5, 7), 35321811044355: (3, 8),
+    35321811044865: (2, 6), 35321811044867: (5, 6), 35321811107841: (6, 3), 35321811107849: (6, 4),
+    35321811107851: (2, 10), 35321811108865: (1, 5), 35321811108867: (2, 9), 35321811173379: (2, 5),
+    35321811173381: (5, 7), 35321811173383: (3, 5), 35321811173889: (5, 6), 35321811173891: (2, 8),
+    35321811304449: (5, 7), 35321811304451: (3, 11), 35321811369985: (3, 10), 35321811369987: (3, 9),
+    35321819430913: (3, 3), 35321819430921: (3, 4), 35321819430923: (3, 11), 35321819431937: (3, 5),
+    35321819431939: (3, 11), 35321819561985: (2, 10), 35321819561987: (2, 11), 35321827819523: (3, 4),
+    35321827819525: (5, 8), 35321827819527: (3, 5), 35321827820033: (5, 7), 35321827820035: (3, 7),
+    35321827885057: (2, 10), 35321827885059: (3, 12), 35321844596737: (5, 6), 35321844596739: (2, 12),
+    35321852985345: (2, 10), 35321852985347: (3, 9), 35322884784129: (6, 4), 35322884784137: (2, 5),
+    35322884784139: (4, 11), 35322884785153: (2, 6), 35322884785155: (4, 11), 35322884915201: (5, 8),
+    35322884915203: (4, 8), 35322901561345: (3, 9), 35322901561347: (4, 8), 35323958525955: (5, 6),
+    35323958525957: (5, 7), 35323958525959: (4, 7), 35323958526465: (5, 7), 35323958526467: (4, 8),
+    35323958591489: (5, 6), 35323958591491: (4, 10), 35323966914561: (3, 7), 35323966914563: (4, 11),
+    35326106009601: (4, 4), 35326106009603: (4, 12), 35327179751425: (4, 10), 35327179751427: (4, 6),
+    35459249995783: (3, 5), 35459249995789: (5, 8), 35459249995791: (3, 7), 35459249996291: (3, 8),
+    35459249996293: (3, 8), 35459249996295: (3, 8), 35459249997313: (3, 7), 35459249997315: (3, 13),
+    35459250061315: (3, 9), 35459250061317: (3, 8), 35459250061319: (3, 9), 35459250061825: (3, 8),
+    35459250061827: (3, 1000000), 35459250192385: (3, 5), 35459250192387: (3, 18), 35459258384387: (2, 9),
+    35459258384389: (5, 5), 35459258384391: (3, 9), 35459258384897: (2, 3), 35459258384899: (2, 1000000),
+    35459258449921: (1, 3), 35459258449923: (1, 1000000), 35459275161601: (3, 4), 35459275161603: (2, 18),
+    35460323737603: (3, 6), 35460323737605: (5, 9), 35460323737607: (3, 8), 35460323738113: (5, 7),
+    35460323738115: (3, 9), 35460323803137: (5, 6), 35460323803139: (3, 11), 35460332126209: (5, 6),
+    35460332126211: (3, 12), 35462471221249: (4, 5), 35462471221251: (4, 12), 35596688949249: (5, 3),
+    35596688949257: (3, 4), 35596688949259: (4, 10), 35596688950273: (2, 5), 35596688950275: (3, 8),
+    35596689080321: (3, 7), 35596689080323: (3, 7), 35596705726465: (5, 7), 35596705726467: (3, 9),
+    35598836432897: (5, 4), 35598836432899: (5, 11), 35734127902723: (3, 6), 35734127902725: (3, 5),
+    35734127902727: (3, 8), 35734127903233: (3, 5), 35734127903235: (3, 8), 35734127968257: (3, 6),
+    35734127968259: (3, 11), 35734136291329: (3, 3), 35734136291331: (3, 12), 35735201644545: (4, 4),
+    35735201644547: (4, 10), 35871566856195: (5, 3), 35871566856197: (6, 8), 35871566856199: (3, 5),
+    35871566856705: (6, 8), 35871566856707: (2, 7), 35871566921729: (3, 6), 35871566921731: (3, 11),
+    35871575244801: (3, 8), 35871575244803: (3, 11), 35872640598017: (2, 8), 35872640598019: (3, 7),
+    36283883716609: (5, 3), 36421322670081: (2, 7), 36421322670083: (3, 7), 36696200577027: (2, 7),
+    52776558133257: (3, 4), 52776558133273: (3, 7), 52776558133275: (3, 7), 52776558134273: (3, 6),
+    52776558134281: (1, 8), 52776558134283: (3, 7), 52776558136321: (3, 11), 52776558136323: (4, 7),
+    52776558264321: (3, 8), 52776558264329: (3, 10), 52776558264331: (3, 7), 52776558265345: (3, 1000000),
+    52776558265347: (3, 6), 52776558526465: (3, 18), 52776558526467: (4, 6), 52776574910465: (3, 9),
+    52776574910473: (3, 10), 52776574910475: (3, 6), 52776574911489: (2, 1000000), 52776574911491: (2, 4),
+    52776575041537: (4, 1000000), 52776575041539: (4, 3), 52776608464897: (2, 18), 52776608464899: (3, 3),
+    52778705616897: (4, 7), 52778705616905: (3, 7), 52778705616907: (4, 7), 52778705617921: (1, 8),
+    52778705617923: (3, 5), 52778705747969: (3, 1000000), 52778705747971: (3, 4), 52778722394113: (2, 1000000),
+    52778722394115: (1, 4), 52783000584193: (3, 15), 52783000584195: (4, 6), 53051436040193: (3, 4),
+    53051436040201: (3, 4), 53051436040203: (5, 8), 53051436041217: (1, 7), 53051436041219: (5, 8),
+    53051436171265: (2, 10), 53051436171267: (5, 6), 53051452817409: (3, 11), 53051452817411: (5, 6),
+    53053583523841: (4, 10), 53053583523843: (5, 7), 53601191854081: (3, 7), 53601191854083: (5, 6),
+    70368744177665: (3, 5), 70368744177669: (3, 5), 70368744177675: (3, 4), 70368744177681: (3, 7),
+    70368744177685: (3, 6), 70368744177687: (3, 6), 70368744178177: (4, 5), 70368744178185: (1, 6),
+    70368744178187: (3, 7), 70368744178691: (3, 3), 70368744178693: (2, 7), 70368744178695: (1, 6),
+    70368744179713: (3, 7), 70368744180225: (3, 7), 70368744180227: (3, 7), 70368744243201: (4, 4),
+    70368744243209: (4, 4), 70368744243211: (3, 9), 70368744244225: (2, 7), 70368744244227: (4, 7),
+    70368744308739: (2, 3), 70368744308741: (3, 9), 70368744308743: (2, 4), 70368744309249: (2, 8),
+    70368744309251: (2, 7), 70368744439809: (3, 6), 70368744505345: (3, 10), 70368744505347: (4, 7),
+    70368752566273: (3, 3), 70368752566281: (3, 4), 70368752566283: (3, 12), 70368752567297: (3, 6),
+    70368752567299: (3, 7), 70368752697345: (3, 10), 70368752697347: (3, 9), 70368760954883: (5, 3),
+    70368760954885: (4, 11), 70368760954887: (5, 3), 70368760955393: (3, 9), 70368760955395: (1, 5),
+    70368761020417: (3, 10), 70368761020419: (3, 6), 70368777732097: (4, 8), 70368786120705: (2, 10),
+    70368786120707: (3, 6), 70369817919489: (4, 3), 70369817919497: (2, 5), 70369817919499: (3, 9),
+    70369817920513: (2, 6), 70369817920515: (2, 7), 70369818050561: (2, 7), 70369818050563: (4, 7),
+    70369834696705: (4, 7), 70369834696707: (3, 10), 70370891661315: (4, 3), 70370891661317: (4, 11),
+    70370891661319: (3, 4), 70370891661825: (4, 9), 70370891661827: (3, 6), 70370891726849: (4, 9),
+    70370891726851: (4, 6), 70370900049921: (3, 8), 70370900049923: (3, 10), 70373039144961: (4, 7),
+    70374112886785: (4, 9), 70374112886787: (4, 5), 70506183131137: (3, 4), 70506183131145: (3, 5),
+    70506183131147: (5, 8), 70506183132161: (2, 8), 70506183132163: (3, 6), 70506183262209: (3, 9),
+    70506183262211: (2, 6), 70506199908353: (2, 9), 70506199908355: (3, 7), 70508330614785: (3, 7),
+    70508330614787: (4, 8), 70643622084611: (3, 4), 70643622084613: (3, 8), 70643622084615: (3, 6),
+    70643622085121: (3, 8), 70643622085123: (3, 8), 70643622150145: (3, 7), 70643622150147: (3, 10),
+    70643630473217: (3, 5), 70643630473219: (3, 10), 70644695826433: (4, 6), 70644695826435: (5, 7),
+    70918499991553: (4, 5), 71055938945025: (3, 7), 71055938945027: (5, 6), 87960930222083: (3, 5),
+    87960930222085: (3, 4), 87960930222091: (3, 5), 87960930222097: (3, 6), 87960930222099: (3, 6),
+    87960930222103: (3, 7), 87960930222593: (3, 3), 87960930222601: (1, 6), 87960930222603: (2, 7),
+    87960930223107: (4, 5), 87960930223109: (3, 7), 87960930223111: (1, 6), 87960930224129: (3, 7),
+    87960930224131: (3, 7), 87960930224643: (3, 7), 87960930287617: (2, 3), 87960930287625: (2, 4),
+    87960930287627: (3, 9), 87960930288641: (2, 7), 87960930288643: (2, 8), 87960930353155: (4, 4),
+    87960930353157: (3, 9), 87960930353159: (4, 4), 87960930353665: (4, 7), 87960930353667: (2, 7),
+    87960930484225: (4, 7), 87960930484227: (3, 10), 87960930549763: (3, 6), 87960938610689: (5, 3),
+    87960938610697: (5, 3), 87960938610699: (4, 11), 87960938611713: (1, 5), 87960938611715: (3, 9),
+    87960938741761: (3, 6), 87960938741763: (3, 10), 87960946999299: (3, 3), 87960946999301: (3, 12),
+    87960946999303: (3, 4), 87960946999809: (3, 7), 87960946999811: (3, 6), 87960947064833: (3, 9),
+    87960947064835: (3, 10), 87960963776513: (3, 6), 87960963776515: (2, 10), 87960972165123: (4, 8),
+    87962003963905: (4, 3), 87962003963913: (3, 4), 87962003963915: (4, 11), 87962003964929: (3, 6),
+    87962003964931: (4, 9), 87962004094977: (4, 6), 87962004094979: (4, 9), 87962020741121: (3, 10),
+    87962020741123: (3, 8), 87963077705731: (4, 3), 87963077705733: (3, 9), 87963077705735: (2, 5),
+    87963077706241: (2, 7), 87963077706243: (2, 6), 87963077771265: (4, 7), 87963077771267: (2, 7),
+    87963086094337: (3, 10), 87963086094339: (4, 7), 87965225189377: (4, 5), 87965225189379: (4, 9),
+    87966298931203: (4, 7), 88098369175553: (3, 4), 88098369175561: (3, 6), 88098369175563: (3, 8),
+    88098369176577: (3, 8), 88098369176579: (3, 8), 88098369306625: (3, 10), 88098369306627: (3, 7),
+    88098385952769: (3, 10), 88098385952771: (3, 5), 88100516659201: (5, 7), 88100516659203: (4, 6),
+    88235808129027: (3, 4), 88235808129029: (5, 8), 88235808129031: (3, 5), 88235808129537: (3, 6),
+    88235808129539: (2, 8), 88235808194561: (2, 6), 88235808194563: (3, 9), 88235816517633: (3, 7),
+    88235816517635: (2, 9), 88236881870849: (4, 8), 88236881870851: (3, 7), 88510686035969: (5, 6),
+    88510686035971: (3, 7), 88648124989443: (4, 5), 105553116266503: (3, 4), 105553116266509: (3, 7),
+    105553116266511: (3, 7), 105553116267011: (3, 6), 105553116267013: (3, 7), 105553116267015: (1, 8),
+    105553116268033: (4, 7), 105553116268035: (3, 11), 105553116332035: (3, 8), 105553116332037: (3, 7),
+    105553116332039: (3, 10), 105553116332545: (3, 6), 105553116332547: (3, 1000000), 105553116463105: (4, 6),
+    105553116463107: (3, 18), 105553124655107: (3, 9), 105553124655109: (3, 6), 105553124655111: (3, 10),
+    105553124655617: (2, 4), 105553124655619: (2, 1000000), 105553124720641: (4, 3), 105553124720643: (4, 1000000),
+    105553141432321: (3, 3), 105553141432323: (2, 18), 105554190008323: (4, 7), 105554190008325: (4, 7),
+    105554190008327: (3, 7), 105554190008833: (3, 5), 105554190008835: (1, 8), 105554190073857: (3, 4),
+    105554190073859: (3, 1000000), 105554198396929: (1, 4), 105554198396931: (2, 1000000), 105556337491969: (4, 6),
+    105556337491971: (3, 15), 105690555219971: (3, 4), 105690555219973: (5, 8), 105690555219975: (3, 4),
+    105690555220481: (5, 8), 105690555220483: (1, 7), 105690555285505: (5, 6), 105690555285507: (2, 10),
+    105690563608577: (5, 6), 105690563608579: (3, 11), 105691628961793: (5, 7), 105691628961795: (4, 10),
+    105965433126913: (5, 6), 105965433126915: (3, 7), 140737488355337: (3, 6), 140737488356353: (3, 6),
+    140737488486401: (3, 8), 140737505132545: (3, 9), 140739635838977: (3, 8), 141012366262273: (4, 6),
+    158329674399745: (3, 5), 158329674399753: (3, 6), 158329674399755: (3, 5), 158329674400769: (3, 8),
+    158329674400771: (3, 5), 158329674530817: (3, 11), 158329674530819: (4, 5), 158329691176961: (3, 13),
+    158329691176963: (3, 4), 158331821883393: (3, 9), 158331821883395: (4, 4), 158604552306689: (3, 8),
+    158604552306691: (5, 5), 175921860444165: (3, 6), 175921860444673: (4, 6), 175921860509697: (2, 6),
+    175921868832769: (3, 5), 175922934185985: (4, 5), 176059299397633: (5, 5), 193514046488587: (3, 6),
+    193514046489603: (4, 6), 193514046619651: (2, 6), 193514063265795: (3, 5), 193516193972227: (4, 5),
+    193788924395523: (5, 5), 211106232532995: (3, 5), 211106232532997: (3, 5), 211106232532999: (3, 6),
+    211106232533505: (3, 5), 211106232533507: (3, 8), 211106232598529: (4, 5), 211106232598531: (3, 11),
+    211106240921601: (3, 4), 211106240921603: (3, 13), 211107306274817: (4, 4), 211107306274819: (3, 9),
+    211243671486465: (5, 5), 211243671486467: (3, 8), 228698418577415: (3, 6), 228698418577923: (3, 6),
+    228698418642947: (3, 8), 228698426966019: (3, 9), 228699492319235: (3, 8), 228835857530883: (4, 6),
+    351843720888321: (2, 6), 439804651110403: (2, 6),
+}